@@ -18,3 +18,15 @@
 # ------------------------------------------------------------------------------
 
 """ cosmpy source code """
+
+import warnings
+
+from google.protobuf.internal import api_implementation
+
+if api_implementation.Type() == "python":  # pragma: no cover
+    warnings.warn(
+        "protobuf is using the pure Python implementation, transaction building "
+        "and response parsing will be considerably slower. Install a protobuf "
+        "release shipping the C++ or upb extension for your platform.",
+        RuntimeWarning,
+    )
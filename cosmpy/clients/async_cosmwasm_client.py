@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Implementation of asynchronous CosmWasm query client."""
+
+import asyncio
+from typing import List
+
+import grpc
+
+from cosmpy.clients.cosmwasm_client import _is_base_account
+from cosmpy.clients.signing_cosmwasm_client import _TX_POLL_RETRIABLE_CODES
+from cosmpy.common.backoff import backoff_delay
+from cosmpy.common.json_utils import json_decode, json_encode
+from cosmpy.common.types import JSONLike
+from cosmpy.crypto.address import Address
+from cosmpy.protos.cosmos.auth.v1beta1.auth_pb2 import BaseAccount
+from cosmpy.protos.cosmos.auth.v1beta1.query_pb2 import QueryAccountRequest
+from cosmpy.protos.cosmos.auth.v1beta1.query_pb2_grpc import QueryStub as AuthGrpcClient
+from cosmpy.protos.cosmos.bank.v1beta1.query_pb2 import (
+    QueryBalanceRequest,
+    QueryBalanceResponse,
+)
+from cosmpy.protos.cosmos.bank.v1beta1.query_pb2_grpc import QueryStub as BankGrpcClient
+from cosmpy.protos.cosmos.tx.v1beta1.service_pb2 import GetTxRequest, GetTxResponse
+from cosmpy.protos.cosmos.tx.v1beta1.service_pb2_grpc import ServiceStub as TxGrpcClient
+from cosmpy.protos.cosmwasm.wasm.v1.query_pb2 import QuerySmartContractStateRequest
+from cosmpy.protos.cosmwasm.wasm.v1.query_pb2_grpc import (
+    QueryStub as CosmWasmGrpcClient,
+)
+
+
+class AsyncCosmWasmClient:
+    """
+    High level asynchronous client for gRPC node interaction.
+
+    All queries are coroutines sharing a single grpc.aio channel, so many
+    requests can be in flight at the same time on one event loop.
+    """
+
+    TX_POLL_INTERVAL = 0.5
+    TX_POLL_MAX_INTERVAL = 4.0
+
+    def __init__(self, channel: grpc.aio.Channel):
+        """
+        :param channel: asynchronous gRPC channel
+        """
+        self.bank_client = BankGrpcClient(channel)
+        self.auth_client = AuthGrpcClient(channel)
+        self.wasm_client = CosmWasmGrpcClient(channel)
+        self.tx_client = TxGrpcClient(channel)
+
+    async def get_balance(self, address: Address, denom: str) -> QueryBalanceResponse:
+        """
+        Get balance of specific account and denom
+
+        :param address: Address
+        :param denom: Denomination
+
+        :return: QueryBalanceResponse
+        """
+        return await self.bank_client.Balance(
+            QueryBalanceRequest(address=str(address), denom=denom)
+        )
+
+    async def query_account_data(self, address: Address) -> BaseAccount:
+        """
+        Query account data for signing
+
+        :param address: Address of account to query data about
+
+        :raises TypeError: in case of wrong account type.
+
+        :return: BaseAccount
+        """
+        account_response = await self.auth_client.Account(
+            QueryAccountRequest(address=str(address))
+        )
+        if not _is_base_account(account_response.account):
+            raise TypeError("Unexpected account type")
+        return BaseAccount.FromString(account_response.account.value)
+
+    async def query_accounts_data(self, addresses: List[Address]) -> List[BaseAccount]:
+        """
+        Query account data of multiple accounts concurrently
+
+        :param addresses: Addresses of accounts to query data about
+
+        :return: List of BaseAccount in the order of addresses
+        """
+        return list(
+            await asyncio.gather(
+                *[self.query_account_data(address) for address in addresses]
+            )
+        )
+
+    async def query_contract_state(
+        self, contract_address: str, msg: JSONLike
+    ) -> JSONLike:
+        """
+        Get state of smart contract
+
+        :param contract_address: Contract address
+        :param msg: Parameters to be passed to query function inside contract
+
+        :return: JSON query response
+        """
+        request = QuerySmartContractStateRequest(
+            address=contract_address, query_data=json_encode(msg)
+        )
+        res = await self.wasm_client.SmartContractState(request)
+        return json_decode(res.data)
+
+    async def wait_for_tx(self, txhash: str, timeout: float = 10) -> GetTxResponse:
+        """
+        Poll transaction receipt with exponential backoff until it is available
+
+        Receipts of multiple transactions can be awaited concurrently with asyncio.gather.
+
+        :param txhash: Transaction hash
+        :param timeout: Maximum number of seconds to wait
+
+        :raises grpc.RpcError: if receipt is not available before timeout or on non-transient error.
+
+        :return: GetTxResponse
+        """
+        tx_request = GetTxRequest(hash=txhash)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        attempt = 0
+        while True:
+            try:
+                return await self.tx_client.GetTx(tx_request)
+            except grpc.RpcError as error:
+                # Transaction is not included in a block yet
+                remaining = deadline - loop.time()
+                if remaining <= 0 or error.code() not in _TX_POLL_RETRIABLE_CODES:
+                    raise
+                delay = backoff_delay(
+                    attempt, self.TX_POLL_INTERVAL, self.TX_POLL_MAX_INTERVAL
+                )
+                await asyncio.sleep(min(delay, remaining))
+                attempt += 1
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Implementation of asynchronous CosmWasm signing client."""
+
+from typing import List, Optional
+
+import grpc
+from google.protobuf.any_pb2 import Any as ProtoAny
+
+from cosmpy.clients.async_cosmwasm_client import AsyncCosmWasmClient
+from cosmpy.clients.signing_cosmwasm_client import SigningCosmWasmClient, _build_tx
+from cosmpy.crypto.address import Address
+from cosmpy.crypto.keypairs import PrivateKey
+from cosmpy.protos.cosmos.base.abci.v1beta1.abci_pb2 import TxResponse
+from cosmpy.protos.cosmos.base.v1beta1.coin_pb2 import Coin
+from cosmpy.protos.cosmos.tx.v1beta1.service_pb2 import (
+    BroadcastMode,
+    BroadcastTxRequest,
+    GetTxResponse,
+)
+from cosmpy.protos.cosmos.tx.v1beta1.tx_pb2 import Tx
+from cosmpy.tx import sign_transaction
+
+
+class AsyncSigningCosmWasmClient(AsyncCosmWasmClient):
+    """High level asynchronous client for gRPC node interaction with ability to sign transactions."""
+
+    DEFAULT_GAS_LIMIT = SigningCosmWasmClient.DEFAULT_GAS_LIMIT
+
+    def __init__(
+        self,
+        private_key: PrivateKey,
+        channel: grpc.aio.Channel,
+        chain_id: str,
+        broadcast_mode: int = BroadcastMode.BROADCAST_MODE_SYNC,
+    ):
+        """
+        :param private_key: Private key used for signing
+        :param channel: asynchronous gRPC channel
+        :param chain_id: Chain ID
+        :param broadcast_mode: Broadcast mode, with BROADCAST_MODE_BLOCK the node replies once Tx is in a block
+        """
+        super().__init__(channel)
+
+        self.private_key = private_key
+
+        self.address = Address(self.private_key)
+        self.public_key_bytes = private_key.public_key_bytes
+        # Queried on first signing, constructor can not await
+        self.account_number: Optional[int] = None
+        self.chain_id = chain_id
+        self.broadcast_mode = broadcast_mode
+
+    async def generate_tx(
+        self,
+        packed_msgs: List[ProtoAny],
+        from_addresses: List[Address],
+        pub_keys: List[bytes],
+        fee: Optional[List[Coin]] = None,
+        memo: str = "",
+        gas_limit: int = DEFAULT_GAS_LIMIT,
+    ) -> Tx:
+        """
+        Generate transaction that can be later signed
+
+        Account data of all senders are queried concurrently.
+
+        :param packed_msgs: Messages to be in transaction
+        :param from_addresses: List of addresses of each sender
+        :param pub_keys: List of public keys
+        :param fee: Transaction fee
+        :param memo: Memo
+        :param gas_limit: Gas limit
+
+        :return: Tx
+        """
+        accounts = await self.query_accounts_data(from_addresses)
+        return _build_tx(packed_msgs, accounts, pub_keys, fee, memo, gas_limit)
+
+    async def sign_tx(self, tx: Tx):
+        """
+        Sign transaction
+
+        :param tx: Transaction to be signed
+        """
+        if self.account_number is None:
+            account = await self.query_account_data(self.address)
+            self.account_number = account.account_number
+        sign_transaction(tx, self.private_key, self.chain_id, self.account_number)
+
+    async def broadcast_tx(self, tx: Tx, wait_time: int = 10) -> GetTxResponse:
+        """
+        Broadcast transaction and get receipt
+
+        RuntimeError is raised if broadcasting fails and grpc.RpcError if
+        receipt is not available in time.
+
+        :param tx: Transaction
+        :param wait_time: Maximum number of seconds to wait for transaction receipt, unused in block mode
+
+        :return: GetTxResponse
+        """
+        tx_response = await self._broadcast(tx)
+
+        if self.broadcast_mode == BroadcastMode.BROADCAST_MODE_BLOCK:
+            # Node replied after the block was committed, no need to poll the receipt
+            return GetTxResponse(tx=tx, tx_response=tx_response)
+
+        return await self.wait_for_tx(tx_response.txhash, wait_time)
+
+    async def submit_tx(self, tx: Tx) -> str:
+        """
+        Broadcast transaction without waiting for its receipt
+
+        :param tx: Transaction
+
+        :return: Transaction hash
+        """
+        tx_response = await self._broadcast(tx)
+        return tx_response.txhash
+
+    async def send_tokens(
+        self, to_address: Address, amount: List[Coin]
+    ) -> GetTxResponse:
+        """
+        Send native tokens from clients address to to_address
+
+        :param to_address: Address of recipient
+        :param amount: List of tokens to be transferred
+
+        :return: GetTxResponse
+        """
+        msg = SigningCosmWasmClient.get_packed_send_msg(
+            from_address=self.address, to_address=to_address, amount=amount
+        )
+
+        tx = await self.generate_tx([msg], [self.address], [self.public_key_bytes])
+        await self.sign_tx(tx)
+        return await self.broadcast_tx(tx)
+
+    async def _broadcast(self, tx: Tx) -> TxResponse:
+        """
+        Broadcast transaction and check that it was accepted by the node
+
+        :param tx: Transaction
+
+        :raises RuntimeError: if broadcasting fails.
+
+        :return: TxResponse of broadcast
+        """
+        broad_tx_req = BroadcastTxRequest(
+            tx_bytes=tx.SerializeToString(), mode=self.broadcast_mode
+        )
+        broad_tx_resp = await self.tx_client.BroadcastTx(broad_tx_req)
+
+        if broad_tx_resp.tx_response.code != 0:
+            raw_log = broad_tx_resp.tx_response.raw_log
+            raise RuntimeError(f"Transaction failed: {raw_log}")
+
+        return broad_tx_resp.tx_response
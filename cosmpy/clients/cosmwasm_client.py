@@ -19,13 +19,20 @@
 
 """Implementation of CosmWasm query client."""
 
-import json
-from typing import Union
+import time
+from collections import OrderedDict
+from functools import partial
+from itertools import chain, repeat
+from typing import Any, Callable, List, Tuple, Union
 
+from google.protobuf.any_pb2 import Any as ProtoAny
 from grpc._channel import Channel
 
 from cosmpy.auth.rest_client import AuthRestClient
 from cosmpy.bank.rest_client import BankRestClient
+from cosmpy.common.backoff import call_with_retries
+from cosmpy.common.channel_pool import ChannelPool
+from cosmpy.common.json_utils import json_decode, json_encode
 from cosmpy.common.rest_client import RestClient
 from cosmpy.common.types import JSONLike
 from cosmpy.cosmwasm.rest_client import CosmWasmRestClient
@@ -43,18 +50,43 @@ from cosmpy.protos.cosmwasm.wasm.v1.query_pb2_grpc import (
     QueryStub as CosmWasmGrpcClient,
 )
 
+_BASE_ACCOUNT_TYPE_NAME = BaseAccount.DESCRIPTOR.full_name
+_BASE_ACCOUNT_TYPE_URL = "/" + _BASE_ACCOUNT_TYPE_NAME
+
+
+def _is_base_account(packed_account: ProtoAny) -> bool:
+    """
+    Check that packed account is BaseAccount
+
+    :param packed_account: Packed account of account query response
+
+    :return: True if account is BaseAccount
+    """
+    type_url = packed_account.type_url
+    # Nodes use "/" prefix, other prefixes are accepted like in Any.Is
+    return (
+        type_url == _BASE_ACCOUNT_TYPE_URL
+        or type_url.rpartition("/")[2] == _BASE_ACCOUNT_TYPE_NAME
+    )
+
 
 class CosmWasmClient:
     """High level client for REST/gRPC node interaction."""
 
-    def __init__(self, channel: Union[Channel, RestClient]):
+    MAX_CONCURRENT_QUERIES = 100
+    MAX_CACHE_SIZE = 1024
+    QUERY_RETRIES = 3
+    QUERY_RETRY_INTERVAL = 0.2
+    QUERY_RETRY_MAX_INTERVAL = 2.0
+
+    def __init__(self, channel: Union[Channel, ChannelPool, RestClient]):
         """
-        :param channel: gRPC or REST querying client
+        :param channel: gRPC channel, pool of gRPC channels or REST querying client
 
         :raises RuntimeError: if channel is of wrong type.
         """
 
-        if isinstance(channel, Channel):
+        if isinstance(channel, (Channel, ChannelPool)):
             self.bank_client: Union[BankRestClient, BankGrpcClient] = BankGrpcClient(
                 channel
             )
@@ -73,19 +105,52 @@ class CosmWasmClient:
                 f"Unsupported channel type {type(channel)}"
             )  # pragma: no cover
 
-    def get_balance(self, address: Address, denom: str) -> QueryBalanceResponse:
+        # Response cache in insertion order: key -> (expiry time, response)
+        self._cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+
+    def get_balance(
+        self, address: Address, denom: str, cache_ttl: float = 0.0
+    ) -> QueryBalanceResponse:
         """
         Get balance of specific account and denom
 
         :param address: Address
         :param denom: Denomination
+        :param cache_ttl: Number of seconds a cached balance can be reused, caching is disabled if 0
 
         :return: QueryBalanceResponse
         """
-        res = self.bank_client.Balance(
-            QueryBalanceRequest(address=str(address), denom=denom)
+        request = QueryBalanceRequest(address=str(address), denom=denom)
+        if cache_ttl <= 0:
+            return self.bank_client.Balance(request)
+
+        # Response is cached serialized so that callers can not modify the cached one
+        data = self._cached(
+            ("balance", request.address, denom),
+            cache_ttl,
+            lambda: self.bank_client.Balance(request).SerializeToString(),
         )
-        return res
+        return QueryBalanceResponse.FromString(data)
+
+    def get_balances(
+        self, addresses: List[Address], denom: str
+    ) -> List[QueryBalanceResponse]:
+        """
+        Get balances of multiple accounts for specific denom
+
+        When supported by the underlying gRPC client the queries are issued
+        concurrently so that all balances are fetched in a single round trip.
+
+        :param addresses: Addresses of accounts
+        :param denom: Denomination
+
+        :return: List of QueryBalanceResponse in the order of addresses
+        """
+        requests = [
+            QueryBalanceRequest(address=str(address), denom=denom)
+            for address in addresses
+        ]
+        return self._concurrent_calls(self.bank_client.Balance, requests)
 
     def query_account_data(self, address: Address) -> BaseAccount:
         """
@@ -97,28 +162,149 @@ class CosmWasmClient:
 
         :return: BaseAccount
         """
-        # Get account data for signing
-        account_response = self.auth_client.Account(
-            QueryAccountRequest(address=str(address))
+        # Get account data for signing, node may be briefly unavailable
+        request = QueryAccountRequest(address=str(address))
+        account_response = self._call_with_retries(
+            lambda: self.auth_client.Account(request)
         )
-        account = BaseAccount()
-        if account_response.account.Is(BaseAccount.DESCRIPTOR):
-            account_response.account.Unpack(account)
-        else:
-            raise TypeError("Unexpected account type")  # pragma: no cover
-        return account
+        if not _is_base_account(account_response.account):
+            raise TypeError("Unexpected account type")
+        return BaseAccount.FromString(account_response.account.value)
+
+    def query_accounts_data(self, addresses: List[Address]) -> List[BaseAccount]:
+        """
+        Query account data of multiple accounts for signing
+
+        When supported by the underlying gRPC client the queries are issued
+        concurrently so that all accounts are fetched in a single round trip.
+
+        :param addresses: Addresses of accounts to query data about
 
-    def query_contract_state(self, contract_address: str, msg: JSONLike) -> JSONLike:
+        :raises TypeError: in case of wrong account type.
+
+        :return: List of BaseAccount in the order of addresses
+        """
+        requests = [QueryAccountRequest(address=str(address)) for address in addresses]
+        responses = self._concurrent_calls(self.auth_client.Account, requests)
+        if not all(_is_base_account(response.account) for response in responses):
+            raise TypeError("Unexpected account type")
+        return [
+            BaseAccount.FromString(response.account.value) for response in responses
+        ]
+
+    def query_contract_state(
+        self, contract_address: str, msg: JSONLike, cache_ttl: float = 0.0
+    ) -> JSONLike:
         """
         Get state of smart contract
 
         :param contract_address: Contract address
         :param msg: Parameters to be passed to query function inside contract
+        :param cache_ttl: Number of seconds a cached response can be reused, caching is disabled if 0
 
         :return: JSON query response
         """
         request = QuerySmartContractStateRequest(
-            address=contract_address, query_data=json.dumps(msg).encode("UTF8")
+            address=contract_address, query_data=json_encode(msg)
         )
-        res = self.wasm_client.SmartContractState(request)
-        return json.loads(res.data)
+        data = self._cached(
+            ("contract_state", contract_address, request.query_data),
+            cache_ttl,
+            lambda: self.wasm_client.SmartContractState(request).data,
+        )
+        return json_decode(data)
+
+    def clear_cache(self):
+        """Drop all cached query responses."""
+        self._cache.clear()
+
+    def _concurrent_calls(self, call: Callable, requests: List[Any]) -> List[Any]:
+        """
+        Issue the same query for multiple requests
+
+        Requests are sent concurrently in chunks of MAX_CONCURRENT_QUERIES using
+        gRPC futures, or one by one if the client has no asynchronous interface.
+        Requests failing with a transient error are retried one by one.
+
+        :param call: Query method of gRPC or REST client
+        :param requests: Requests to be passed to the query method
+
+        :return: List of responses in the order of requests
+        """
+        future_call = getattr(call, "future", None)
+
+        if future_call is None:
+            # REST client has no asynchronous interface
+            return [self._call_with_retries(partial(call, req)) for req in requests]
+
+        responses: List[Any] = []
+        chunk_size = self.MAX_CONCURRENT_QUERIES
+        for start in range(0, len(requests), chunk_size):
+            end = start + chunk_size
+            futures = [future_call(req) for req in requests[start:end]]
+            responses.extend(
+                self._result_with_retries(future, partial(call, req))
+                for req, future in zip(requests[start:end], futures)
+            )
+        return responses
+
+    def _call_with_retries(self, query: Callable[[], Any]) -> Any:
+        """
+        Run query retrying transient gRPC errors
+
+        :param query: Function performing the query
+
+        :return: query result
+        """
+        return call_with_retries(
+            query,
+            self.QUERY_RETRIES,
+            self.QUERY_RETRY_INTERVAL,
+            self.QUERY_RETRY_MAX_INTERVAL,
+        )
+
+    def _result_with_retries(self, future: Any, query: Callable[[], Any]) -> Any:
+        """
+        Get result of query future retrying transient gRPC errors
+
+        :param future: Future of the first attempt
+        :param query: Function performing the query again
+
+        :return: query result
+        """
+        attempts = chain([future.result], repeat(query))
+
+        def attempt() -> Any:
+            return next(attempts)()
+
+        return self._call_with_retries(attempt)
+
+    def _cached(
+        self, key: Tuple[Any, ...], ttl: float, query: Callable[[], Any]
+    ) -> Any:
+        """
+        Return cached result of query or run the query and cache its result
+
+        :param key: Cache key
+        :param ttl: Number of seconds the result can be reused, caching is disabled if 0
+        :param query: Function performing the query
+
+        :return: query result
+        """
+        if ttl <= 0:
+            return query()
+
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                self._cache.move_to_end(key)
+                return entry[1]
+            del self._cache[key]
+
+        result = query()
+        if len(self._cache) >= self.MAX_CACHE_SIZE:
+            # Evict the least recently used entry to keep the cache bounded
+            self._cache.popitem(last=False)
+        self._cache[key] = (now + ttl, result)
+        return result
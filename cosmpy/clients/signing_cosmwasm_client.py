@@ -19,22 +19,31 @@
 
 """Implementation of CosmWasm signing client."""
 
+import functools
 import gzip
-import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import grpc
 from google.protobuf.any_pb2 import Any as ProtoAny
+from google.protobuf.message import Message
 from grpc._channel import Channel
 
 from cosmpy.clients.cosmwasm_client import CosmWasmClient
+from cosmpy.common.backoff import backoff_delay
+from cosmpy.common.channel_pool import ChannelPool
+from cosmpy.common.json_utils import json_decode, json_encode
 from cosmpy.common.rest_client import RestClient
 from cosmpy.common.types import JSONLike
 from cosmpy.crypto.address import Address
+from cosmpy.crypto.hashfuncs import ripemd160, sha256
 from cosmpy.crypto.keypairs import PrivateKey
 from cosmpy.protos.cosmos.auth.v1beta1.auth_pb2 import BaseAccount
 from cosmpy.protos.cosmos.bank.v1beta1.tx_pb2 import MsgSend
+from cosmpy.protos.cosmos.base.abci.v1beta1.abci_pb2 import TxResponse
 from cosmpy.protos.cosmos.base.v1beta1.coin_pb2 import Coin
 from cosmpy.protos.cosmos.crypto.secp256k1.keys_pb2 import PubKey as ProtoPubKey
 from cosmpy.protos.cosmos.tx.signing.v1beta1.signing_pb2 import SignMode
@@ -45,14 +54,7 @@ from cosmpy.protos.cosmos.tx.v1beta1.service_pb2 import (
     GetTxResponse,
 )
 from cosmpy.protos.cosmos.tx.v1beta1.service_pb2_grpc import ServiceStub as TxGrpcClient
-from cosmpy.protos.cosmos.tx.v1beta1.tx_pb2 import (
-    AuthInfo,
-    Fee,
-    ModeInfo,
-    SignerInfo,
-    Tx,
-    TxBody,
-)
+from cosmpy.protos.cosmos.tx.v1beta1.tx_pb2 import ModeInfo, Tx
 from cosmpy.protos.cosmwasm.wasm.v1.tx_pb2 import (
     MsgExecuteContract,
     MsgInstantiateContract,
@@ -61,29 +63,148 @@ from cosmpy.protos.cosmwasm.wasm.v1.tx_pb2 import (
 from cosmpy.tx import sign_transaction
 from cosmpy.tx.rest_client import TxRestClient
 
+try:
+    from isal import igzip as gzip_module
+except ImportError:  # pragma: no cover
+    gzip_module = gzip  # type: ignore
+
+# gRPC status codes of GetTx meaning that the transaction may still be included
+_TX_POLL_RETRIABLE_CODES = frozenset(
+    {grpc.StatusCode.NOT_FOUND, grpc.StatusCode.UNAVAILABLE}
+)
+
+# Sign mode of every signer, the same for all transactions
+_MODE_INFO_DIRECT = ModeInfo(single=ModeInfo.Single(mode=SignMode.SIGN_MODE_DIRECT))
+
+# Bytecode is compressed once per deployment, so favour speed over ratio
+WASM_GZIP_LEVEL = 1
+
+
+@functools.lru_cache(maxsize=32)
+def _load_gzipped_wasm(
+    path: str, mtime_ns: int, size: int  # pylint: disable=unused-argument
+) -> bytes:
+    """
+    Load and compress contract bytecode
+
+    Modification time and size are part of the cache key so that a changed file is reloaded.
+
+    :param path: Path to smart contract bytecode
+    :param mtime_ns: Modification time of the file in nanoseconds
+    :param size: Size of the file in bytes
+
+    :return: gzip compressed bytecode
+    """
+    with open(path, "rb") as contract_file:
+        return gzip_module.compress(contract_file.read(), WASM_GZIP_LEVEL)
+
+
+# Message class -> type URL used when packing into ProtoAny
+_TYPE_URL_CACHE: Dict[type, str] = {}
+
+
+def _pack(msg: Message) -> ProtoAny:
+    """
+    Pack protobuf message into ProtoAny
+
+    Equivalent to ProtoAny.Pack with "/" type URL prefix, with the type URL
+    looked up once per message class.
+
+    :param msg: Protobuf message
+
+    :return: Packed message
+    """
+    msg_type = type(msg)
+    type_url = _TYPE_URL_CACHE.get(msg_type)
+    if type_url is None:
+        type_url = _TYPE_URL_CACHE.setdefault(msg_type, "/" + msg.DESCRIPTOR.full_name)
+    return ProtoAny(type_url=type_url, value=msg.SerializeToString())
+
+
+@functools.lru_cache(maxsize=256)
+def _pack_public_key(pub_key: bytes) -> ProtoAny:
+    """
+    Pack public key bytes into ProtoAny
+
+    Result is shared between calls and must not be modified.
+
+    :param pub_key: Public key bytes
+
+    :return: Packed secp256k1 PubKey
+    """
+    return _pack(ProtoPubKey(key=pub_key))
+
+
+def _build_tx(
+    packed_msgs: List[ProtoAny],
+    accounts: List[BaseAccount],
+    pub_keys: List[bytes],
+    fee: Optional[List[Coin]],
+    memo: str,
+    gas_limit: int,
+) -> Tx:
+    """
+    Build unsigned transaction
+
+    :param packed_msgs: Messages to be in transaction
+    :param accounts: Account info of each signer
+    :param pub_keys: Public key of each signer
+    :param fee: Transaction fee
+    :param memo: Memo
+    :param gas_limit: Gas limit
+
+    :return: Tx
+    """
+    # Fill Tx body and auth info in place instead of copying separate messages
+    tx = Tx()
+    tx.body.memo = memo
+    tx.body.messages.extend(packed_msgs)
+    signer_infos = tx.auth_info.signer_infos
+    for account, pub_key in zip(accounts, pub_keys):
+        signer_infos.add(
+            public_key=_pack_public_key(pub_key),
+            mode_info=_MODE_INFO_DIRECT,
+            sequence=account.sequence,
+        )
+    tx.auth_info.fee.gas_limit = gas_limit
+    if fee is not None:
+        tx.auth_info.fee.amount.extend(fee)
+    return tx
+
 
 class SigningCosmWasmClient(CosmWasmClient):
     """High level client for REST/gRPC node interaction with ability to sign transactions."""
 
     DEFAULT_GAS_LIMIT = 200000
     DEFAULT_DEPLOY_GAS_LIMIT = 3000000
+    MAX_MSGS_PER_TX = 100
+    TX_POLL_INTERVAL = 0.5
+    TX_POLL_MAX_INTERVAL = 4.0
+
+    # Keys of transaction log attributes
+    CODE_ID_KEY = "code_id"
+    CONTRACT_ADDRESS_KEY = "_contract_address"
 
     def __init__(
         self,
         private_key: PrivateKey,
-        channel: Union[Channel, RestClient],
+        channel: Union[Channel, ChannelPool, RestClient],
         chain_id: str,
+        broadcast_mode: int = BroadcastMode.BROADCAST_MODE_SYNC,
+        account_cache_ttl: float = 0.0,
     ):
         """
         :param private_key: Private key used for signing
-        :param channel: REST or gRPC querying client
+        :param channel: REST querying client, gRPC channel or pool of gRPC channels
         :param chain_id: Chain ID
+        :param broadcast_mode: Broadcast mode, with BROADCAST_MODE_BLOCK the node replies once Tx is in a block
+        :param account_cache_ttl: Number of seconds signer account data can be reused, caching is disabled if 0
 
         :raises RuntimeError: if channel is of wrong type.
         """
         super().__init__(channel)
 
-        if isinstance(channel, Channel):
+        if isinstance(channel, (Channel, ChannelPool)):
             self.tx_client: Union[TxRestClient, TxGrpcClient] = TxGrpcClient(channel)
         elif isinstance(channel, RestClient):
             self.tx_client = TxRestClient(channel)
@@ -99,6 +220,11 @@ class SigningCosmWasmClient(CosmWasmClient):
         account = self.query_account_data(self.address)
         self.account_number = account.account_number
         self.chain_id = chain_id
+        self.broadcast_mode = broadcast_mode
+
+        # Signer account cache: raw address -> (expiry time, account)
+        self.account_cache_ttl = account_cache_ttl
+        self._account_cache: Dict[bytes, Tuple[float, BaseAccount]] = {}
 
     def generate_tx(
         self,
@@ -122,28 +248,9 @@ class SigningCosmWasmClient(CosmWasmClient):
         :return: Tx
         """
 
-        # Get account and signer info for each sender
-        accounts: List[BaseAccount] = []
-        signer_infos: List[SignerInfo] = []
-        for from_address, pub_key in zip(from_addresses, pub_keys):
-            account = self.query_account_data(from_address)
-            accounts.append(account)
-            signer_infos.append(self._get_signer_info(account, pub_key))
-
-        # Prepare auth info
-        auth_info = AuthInfo(
-            signer_infos=signer_infos,
-            fee=Fee(amount=fee, gas_limit=gas_limit),
-        )
-
-        # Prepare Tx body
-        tx_body = TxBody()
-        tx_body.memo = memo
-        tx_body.messages.extend(packed_msgs)
-
-        # Prepare Tx
-        tx = Tx(body=tx_body, auth_info=auth_info)
-        return tx
+        # Get account info for each sender
+        accounts = self._get_signer_accounts(from_addresses)
+        return _build_tx(packed_msgs, accounts, pub_keys, fee, memo, gas_limit)
 
     def sign_tx(self, tx: Tx):
         """
@@ -157,29 +264,77 @@ class SigningCosmWasmClient(CosmWasmClient):
         """
         Broadcast transaction and get receipt
 
-        :param tx: Transaction
-        :param wait_time: Number of seconds to wait before getting transaction receipt
+        RuntimeError or grpc.RpcError is raised if broadcasting fails or receipt
+        is not available in time.
 
-        :raises RuntimeError: if broadcasting fails.
+        :param tx: Transaction
+        :param wait_time: Maximum number of seconds to wait for transaction receipt, unused in block mode
 
         :return: GetTxResponse
         """
-        tx_data = tx.SerializeToString()
-        broad_tx_req = BroadcastTxRequest(
-            tx_bytes=tx_data, mode=BroadcastMode.BROADCAST_MODE_SYNC
-        )
-        broad_tx_resp = self.tx_client.BroadcastTx(broad_tx_req)
+        tx_response = self._broadcast(tx)
 
-        if broad_tx_resp.tx_response.code != 0:
-            raw_log = broad_tx_resp.tx_response.raw_log
-            raise RuntimeError(f"Transaction failed: {raw_log}")
+        if self.broadcast_mode == BroadcastMode.BROADCAST_MODE_BLOCK:
+            # Node replied after the block was committed, no need to poll the receipt
+            self.clear_cache()
+            return GetTxResponse(tx=tx, tx_response=tx_response)
+
+        # Wait for transaction to settle and get its receipt
+        return self.wait_for_tx(tx_response.txhash, wait_time)
+
+    def submit_tx(self, tx: Tx) -> str:
+        """
+        Broadcast transaction without waiting for its receipt
 
-        # Wait for transaction to settle
-        time.sleep(wait_time)
+        Receipts of submitted transactions can be awaited later with wait_for_tx,
+        so that multiple transactions settle concurrently.
+        RuntimeError or grpc.RpcError is raised if broadcasting fails.
 
-        # Get transaction receipt
-        tx_request = GetTxRequest(hash=broad_tx_resp.tx_response.txhash)
-        tx_response = self.tx_client.GetTx(tx_request)
+        :param tx: Transaction
+
+        :return: Transaction hash
+        """
+        return self._broadcast(tx).txhash
+
+    def wait_for_tx(self, txhash: str, timeout: float = 10) -> GetTxResponse:
+        """
+        Poll transaction receipt with exponential backoff until it is available
+
+        :param txhash: Transaction hash
+        :param timeout: Maximum number of seconds to wait
+
+        :raises RuntimeError: if REST receipt is not available before timeout.
+        :raises grpc.RpcError: if gRPC receipt is not available before timeout or on non-transient error.
+
+        :return: GetTxResponse
+        """
+        tx_request = GetTxRequest(hash=txhash)
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            try:
+                tx_response = self.tx_client.GetTx(tx_request)
+                break
+            except grpc.RpcError as error:
+                # Transaction is not included in a block yet
+                if (
+                    error.code() not in _TX_POLL_RETRIABLE_CODES
+                    or time.monotonic() >= deadline
+                ):
+                    raise
+            except RuntimeError:
+                # REST client reports missing transaction as RuntimeError
+                if time.monotonic() >= deadline:
+                    raise
+            remaining = max(deadline - time.monotonic(), 0.0)
+            delay = backoff_delay(
+                attempt, self.TX_POLL_INTERVAL, self.TX_POLL_MAX_INTERVAL
+            )
+            time.sleep(min(delay, remaining))
+            attempt += 1
+
+        # Balances and contract states may have changed
+        self.clear_cache()
 
         return tx_response
 
@@ -199,10 +354,7 @@ class SigningCosmWasmClient(CosmWasmClient):
         msg_send = MsgSend(
             from_address=str(from_address), to_address=str(to_address), amount=amount
         )
-        send_msg_packed = ProtoAny()
-        send_msg_packed.Pack(msg_send, type_url_prefix="/")
-
-        return send_msg_packed
+        return _pack(msg_send)
 
     @staticmethod
     def get_packed_store_msg(
@@ -216,17 +368,47 @@ class SigningCosmWasmClient(CosmWasmClient):
 
         :return: Packed MsgStoreCode
         """
-        with open(contract_filename, "rb") as contract_file:
-            wasm_byte_code = gzip.compress(contract_file.read(), 6)
+        stat = os.stat(contract_filename)
+        wasm_byte_code = _load_gzipped_wasm(
+            str(contract_filename), stat.st_mtime_ns, stat.st_size
+        )
 
         msg_send = MsgStoreCode(
             sender=str(sender_address),
             wasm_byte_code=wasm_byte_code,
         )
-        send_msg_packed = ProtoAny()
-        send_msg_packed.Pack(msg_send, type_url_prefix="/")
+        return _pack(msg_send)
+
+    @staticmethod
+    def get_packed_store_msgs(
+        sender_address: Address, contract_filenames: List[Path]
+    ) -> List[ProtoAny]:
+        """
+        Loads multiple contract bytecodes and return packed MsgStoreCode for each
+
+        Bytecodes are compressed in parallel threads, compression releases the GIL.
 
-        return send_msg_packed
+        :param sender_address: Address of transaction sender
+        :param contract_filenames: Paths to smart contract bytecodes
+
+        :return: List of packed MsgStoreCode in the order of contract_filenames
+        """
+        if len(contract_filenames) <= 1:
+            return [
+                SigningCosmWasmClient.get_packed_store_msg(sender_address, filename)
+                for filename in contract_filenames
+            ]
+
+        max_workers = min(len(contract_filenames), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda filename: SigningCosmWasmClient.get_packed_store_msg(
+                        sender_address, filename
+                    ),
+                    contract_filenames,
+                )
+            )
 
     @staticmethod
     def get_packed_init_msg(
@@ -250,14 +432,11 @@ class SigningCosmWasmClient(CosmWasmClient):
         msg_send = MsgInstantiateContract(
             sender=str(sender_address),
             code_id=code_id,
-            msg=json.dumps(init_msg).encode("UTF8"),
+            msg=json_encode(init_msg),
             label=label,
             funds=funds,
         )
-        send_msg_packed = ProtoAny()
-        send_msg_packed.Pack(msg_send, type_url_prefix="/")
-
-        return send_msg_packed
+        return _pack(msg_send)
 
     @staticmethod
     def get_packed_exec_msg(
@@ -279,13 +458,10 @@ class SigningCosmWasmClient(CosmWasmClient):
         msg_send = MsgExecuteContract(
             sender=str(sender_address),
             contract=contract_address,
-            msg=json.dumps(msg).encode("UTF8"),
+            msg=json_encode(msg),
             funds=funds,
         )
-        send_msg_packed = ProtoAny()
-        send_msg_packed.Pack(msg_send, type_url_prefix="/")
-
-        return send_msg_packed
+        return _pack(msg_send)
 
     # Higher level methods
     def send_tokens(self, to_address: Address, amount: List[Coin]) -> GetTxResponse:
@@ -305,6 +481,47 @@ class SigningCosmWasmClient(CosmWasmClient):
         self.sign_tx(tx)
         return self.broadcast_tx(tx)
 
+    def send_tokens_batch(
+        self,
+        to_addresses: List[Address],
+        amount: List[Coin],
+        chunk_size: int = MAX_MSGS_PER_TX,
+        gas_limit_per_msg: int = DEFAULT_GAS_LIMIT,
+    ) -> List[GetTxResponse]:
+        """
+        Send the same amount of native tokens from clients address to multiple recipients
+
+        Transfers are bundled as multiple MsgSend messages into transactions of
+        at most chunk_size messages, so each chunk is signed and included in a
+        block only once.
+
+        :param to_addresses: Addresses of recipients
+        :param amount: List of tokens to be transferred to each recipient
+        :param chunk_size: Maximum number of transfers in a single transaction
+        :param gas_limit_per_msg: Gas limit of a single transfer
+
+        :return: List of GetTxResponse, one per transaction
+        """
+        responses: List[GetTxResponse] = []
+        for start in range(0, len(to_addresses), chunk_size):
+            end = start + chunk_size
+            msgs = [
+                self.get_packed_send_msg(
+                    from_address=self.address, to_address=to_address, amount=amount
+                )
+                for to_address in to_addresses[start:end]
+            ]
+
+            tx = self.generate_tx(
+                msgs,
+                [self.address],
+                [self.public_key_bytes],
+                gas_limit=gas_limit_per_msg * len(msgs),
+            )
+            self.sign_tx(tx)
+            responses.append(self.broadcast_tx(tx))
+        return responses
+
     def deploy_contract(
         self, contract_filename: Path, gas_limit: int = DEFAULT_DEPLOY_GAS_LIMIT
     ) -> int:
@@ -398,11 +615,17 @@ class SigningCosmWasmClient(CosmWasmClient):
 
         :param response: Response of store code transaction
 
+        :raises RuntimeError: if code id is not found in the transaction log
+
         :return: integer code_id
         """
-        raw_log = json.loads(response.tx_response.raw_log)
-        assert raw_log[0]["events"][1]["attributes"][0]["key"] == "code_id"
-        return int(raw_log[0]["events"][1]["attributes"][0]["value"])
+        raw_log = json_decode(response.tx_response.raw_log)
+        value = SigningCosmWasmClient._find_attribute_value(
+            raw_log, SigningCosmWasmClient.CODE_ID_KEY
+        )
+        if value is None:
+            raise RuntimeError(f"No code id found in transaction log: {raw_log}")
+        return int(value)
 
     @staticmethod
     def get_contract_address(response: GetTxResponse) -> str:
@@ -410,34 +633,145 @@ class SigningCosmWasmClient(CosmWasmClient):
         Get contract address from instantiate msg response
         :param response: Response of MsgInstantiateContract transaction
 
+        :raises RuntimeError: if contract address is not found in the transaction log
+
         :return: contract address string
         """
-        raw_log = json.loads(response.tx_response.raw_log)
-        assert raw_log[0]["events"][0]["attributes"][0]["key"] == "_contract_address"
-        return str(raw_log[0]["events"][0]["attributes"][0]["value"])
+        raw_log = json_decode(response.tx_response.raw_log)
+        value = SigningCosmWasmClient._find_attribute_value(
+            raw_log, SigningCosmWasmClient.CONTRACT_ADDRESS_KEY
+        )
+        if value is None:
+            raise RuntimeError(
+                f"No contract address found in transaction log: {raw_log}"
+            )
+        return str(value)
 
     # Protected methods
+    def _broadcast(self, tx: Tx) -> TxResponse:
+        """
+        Broadcast transaction and check that it was accepted by the node
+
+        :param tx: Transaction
+
+        :raises RuntimeError: if broadcasting fails.
+        :raises grpc.RpcError: if gRPC broadcast request fails.
+
+        :return: TxResponse of broadcast
+        """
+        # Only the request keeps the serialized Tx alive while the call is in flight
+        broad_tx_req = BroadcastTxRequest(
+            tx_bytes=tx.SerializeToString(), mode=self.broadcast_mode
+        )
+        try:
+            broad_tx_resp = self.tx_client.BroadcastTx(broad_tx_req)
+        except (grpc.RpcError, RuntimeError):
+            # Unknown whether the sequence was consumed
+            self._update_signer_accounts(tx, accepted=False)
+            raise
+
+        if broad_tx_resp.tx_response.code != 0:
+            self._update_signer_accounts(tx, accepted=False)
+            raw_log = broad_tx_resp.tx_response.raw_log
+            raise RuntimeError(f"Transaction failed: {raw_log}")
+
+        # Sequence is consumed once the Tx passes the node's checks
+        self._update_signer_accounts(tx, accepted=True)
+
+        return broad_tx_resp.tx_response
+
+    def _get_signer_accounts(self, addresses: List[Address]) -> List[BaseAccount]:
+        """
+        Get account data of signers, reusing cached data when enabled
+
+        :param addresses: Addresses of signers
+
+        :return: List of BaseAccount in the order of addresses
+        """
+        if self.account_cache_ttl <= 0:
+            return self.query_accounts_data(addresses)
+
+        now = time.monotonic()
+        keys = [bytes(Address(address)) for address in addresses]
+        missing: Dict[bytes, Address] = {}
+        for key, address in zip(keys, addresses):
+            entry = self._account_cache.get(key)
+            if entry is None or entry[0] <= now:
+                missing[key] = address
+
+        if missing:
+            expiry = now + self.account_cache_ttl
+            accounts = self.query_accounts_data(list(missing.values()))
+            for key, account in zip(missing, accounts):
+                self._account_cache[key] = (expiry, account)
+
+        return [self._account_cache[key][1] for key in keys]
+
+    def _update_signer_accounts(self, tx: Tx, accepted: bool):
+        """
+        Update cached account data of transaction signers after broadcast
+
+        :param tx: Broadcast transaction
+        :param accepted: True if the transaction was accepted by the node
+        """
+        if not self._account_cache:
+            return
+
+        for signer_info in tx.auth_info.signer_infos:
+            pub_key = ProtoPubKey.FromString(signer_info.public_key.value).key
+            key = ripemd160(sha256(pub_key))
+            entry = self._account_cache.get(key)
+            if entry is None:
+                continue
+
+            if accepted and entry[1].sequence == signer_info.sequence:
+                # Account may sign again without querying the new sequence
+                entry[1].sequence += 1
+            elif not accepted:
+                self._account_cache.pop(key)
+
     @staticmethod
-    def _get_signer_info(from_acc: BaseAccount, pub_key: bytes) -> SignerInfo:
+    def _find_attribute_value(raw_log: Any, key: str) -> Optional[Any]:
         """
-        Generate signer info
+        Find value of first event attribute with given key in parsed raw log
+
+        :param raw_log: Parsed raw log of transaction
+        :param key: Attribute key
 
-        :param from_acc: Account info of signer
-        :param pub_key: Public key bytes
+        :return: Attribute value or None if not found
+        """
+        # Fast path for the standard [{"events": [{"attributes": [...]}]}] layout
+        try:
+            for log in raw_log:
+                for event in log.get("events", ()):
+                    for attribute in event.get("attributes", ()):
+                        if attribute.get("key") == key:
+                            return attribute["value"]
+        except (AttributeError, KeyError, TypeError):
+            pass
+
+        # Slow path for unexpected layouts
+        item = SigningCosmWasmClient._find_item(raw_log, key)
+        return None if item is None else item["value"]
 
-        :return: SignerInfo
+    @staticmethod
+    def _find_item(raw_log: Any, key: str) -> Optional[Dict[str, Any]]:
         """
+        Find first event attribute with given key in parsed raw log
 
-        from_pub_key_packed = ProtoAny()
-        from_pub_key_pb = ProtoPubKey(key=pub_key)
-        from_pub_key_packed.Pack(from_pub_key_pb, type_url_prefix="/")
+        :param raw_log: Parsed raw log of transaction
+        :param key: Attribute key
 
-        # Prepare auth info
-        single = ModeInfo.Single(mode=SignMode.SIGN_MODE_DIRECT)
-        mode_info = ModeInfo(single=single)
-        signer_info = SignerInfo(
-            public_key=from_pub_key_packed,
-            mode_info=mode_info,
-            sequence=from_acc.sequence,
-        )
-        return signer_info
+        :return: Attribute dict with key and value or None if not found
+        """
+        # Iterative depth-first search in document order
+        stack = [raw_log]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                if item.get("key") == key and "value" in item:
+                    return item
+                stack.extend(reversed(list(item.values())))
+            elif isinstance(item, list):
+                stack.extend(reversed(item))
+        return None
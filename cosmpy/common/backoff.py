@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Retry backoff helpers."""
+
+import random
+import time
+from typing import Callable, Optional, TypeVar
+
+import grpc
+
+T = TypeVar("T")
+
+# gRPC status codes worth retrying for idempotent queries
+RETRIABLE_STATUS_CODES = frozenset({grpc.StatusCode.UNAVAILABLE})
+
+# Trailing metadata key of server requested retry delay in milliseconds
+PUSHBACK_METADATA_KEY = "grpc-retry-pushback-ms"
+
+# Exponent limit preventing float overflow for long running loops
+_MAX_EXPONENT = 32
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Get jittered exponential backoff delay
+
+    The delay is drawn uniformly from the upper half of min(cap, base * 2 ** attempt)
+    so that concurrent clients do not retry in lockstep.
+
+    :param attempt: Number of previous attempts, starting from 0
+    :param base: Delay of the first attempt
+    :param cap: Maximum delay
+
+    :return: delay in seconds
+    """
+    delay = min(cap, base * 2 ** min(attempt, _MAX_EXPONENT))
+    return delay / 2 + random.random() * delay / 2  # nosec
+
+
+def _pushback_delay(error: grpc.RpcError) -> Optional[float]:
+    """
+    Get retry delay requested by the server
+
+    :param error: gRPC error
+
+    :return: delay in seconds, None if the server did not request any and
+        negative if the server requested not to retry
+    """
+    trailing_metadata = getattr(error, "trailing_metadata", None)
+    if trailing_metadata is None:
+        return None
+    for key, value in trailing_metadata() or ():
+        if key == PUSHBACK_METADATA_KEY:
+            # Negative or malformed value means that the call must not be retried
+            try:
+                return int(value) / 1000
+            except ValueError:
+                return -1.0
+    return None
+
+
+def call_with_retries(
+    call: Callable[[], T], retries: int, base: float, cap: float
+) -> T:
+    """
+    Call function retrying transient gRPC errors with exponential backoff
+
+    Errors with status codes other than RETRIABLE_STATUS_CODES are raised immediately.
+    Delay requested by the server in grpc-retry-pushback-ms trailing metadata
+    takes precedence over the backoff delay and is not limited by cap, negative
+    or malformed value stops retrying as in the gRPC retry design.
+
+    :param call: Function to be called
+    :param retries: Maximum number of retries after the first attempt
+    :param base: Delay before the first retry
+    :param cap: Maximum delay between retries
+
+    :raises grpc.RpcError: if the last attempt fails or the error is not transient.
+
+    :return: result of the call
+    """
+    attempt = 0
+    while True:
+        try:
+            return call()
+        except grpc.RpcError as error:
+            # No sleep after the last attempt, the error is raised right away
+            if attempt >= retries or error.code() not in RETRIABLE_STATUS_CODES:
+                raise
+            delay = _pushback_delay(error)
+            if delay is None:
+                delay = backoff_delay(attempt, base, cap)
+            elif delay < 0:
+                raise
+            time.sleep(delay)
+            attempt += 1
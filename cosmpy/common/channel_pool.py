@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Implementation of gRPC channel pool."""
+
+import functools
+import itertools
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import certifi
+import grpc
+
+
+@functools.lru_cache(maxsize=1)
+def default_ssl_credentials() -> grpc.ChannelCredentials:
+    """
+    Get TLS credentials trusting the certifi CA bundle
+
+    The bundle is read once per process and the credentials are shared.
+
+    :return: gRPC channel credentials
+    """
+    with open(certifi.where(), "rb") as ca_file:
+        return grpc.ssl_channel_credentials(root_certificates=ca_file.read())
+
+
+class _RoundRobinMultiCallable:
+    """Multi-callable dispatching each call to the next channel of a pool."""
+
+    def __init__(self, pool: "ChannelPool", callables: List[Any]):
+        """
+        Create round-robin multi-callable
+
+        :param pool: Channel pool providing the round-robin order
+        :param callables: Multi-callables, one per channel of the pool
+        """
+        self._pool = pool
+        self._callables = callables
+
+    def _next(self) -> Any:
+        return self._callables[self._pool.next_index()]
+
+    def __call__(self, *args, **kwargs):
+        return self._next()(*args, **kwargs)
+
+    def with_call(self, *args, **kwargs):
+        """
+        Invoke RPC on the next channel and return response with call object
+
+        :param args: Positional arguments of the underlying multi-callable
+        :param kwargs: Keyword arguments of the underlying multi-callable
+
+        :return: Response and call
+        """
+        return self._next().with_call(*args, **kwargs)
+
+    def future(self, *args, **kwargs):
+        """
+        Invoke RPC asynchronously on the next channel
+
+        :param args: Positional arguments of the underlying multi-callable
+        :param kwargs: Keyword arguments of the underlying multi-callable
+
+        :return: Future of the call
+        """
+        return self._next().future(*args, **kwargs)
+
+
+_SHARED_POOLS: Dict[Tuple[str, int, bool], "ChannelPool"] = {}
+_SHARED_POOLS_LOCK = threading.Lock()
+
+
+class ChannelPool:
+    """
+    Pool of gRPC channels to a single node used in round-robin order.
+
+    Every channel keeps its own HTTP/2 connection so concurrent calls are not
+    serialised behind a single connection's flow-control window. The pool can
+    be passed to the clients in place of a single channel.
+    """
+
+    DEFAULT_SIZE = 4
+    DEFAULT_OPTIONS = (
+        # Channels with equal arguments share connections of the global subchannel
+        # pool, a local pool gives each channel its own connection
+        ("grpc.use_local_subchannel_pool", 1),
+        ("grpc.max_receive_message_length", 50 * 1024 * 1024),
+        ("grpc.keepalive_time_ms", 30000),
+        ("grpc.keepalive_timeout_ms", 10000),
+        ("grpc.http2.max_pings_without_data", 0),
+    )
+
+    def __init__(self, channels: Sequence[grpc.Channel]):
+        """
+        Create channel pool
+
+        :param channels: gRPC channels to be used in round-robin order
+
+        :raises ValueError: if no channel is provided.
+        """
+        if len(channels) == 0:
+            raise ValueError("Channel pool requires at least one channel")
+
+        self._channels = list(channels)
+        # next() on itertools.count is atomic under the GIL
+        self._counter = itertools.count()
+        # Key in the shared pools registry if the pool is shared
+        self._shared_key: Optional[Tuple[str, int, bool]] = None
+
+    @classmethod
+    def create(
+        cls,
+        address: str,
+        size: int = DEFAULT_SIZE,
+        credentials: Optional[grpc.ChannelCredentials] = None,
+        options: Sequence[Tuple[str, Any]] = DEFAULT_OPTIONS,
+        compression: Optional[grpc.Compression] = None,
+        secure: bool = False,
+    ) -> "ChannelPool":
+        """
+        Create pool of channels to the same node
+
+        :param address: Address of gRPC node
+        :param size: Number of channels in the pool
+        :param credentials: Channel credentials, insecure channels are created if None and not secure
+        :param options: gRPC channel options shared by all channels
+        :param compression: Default compression of calls, calls are not compressed if None
+        :param secure: Use default TLS credentials when no credentials are provided
+
+        :return: ChannelPool
+        """
+        if credentials is None and secure:
+            credentials = default_ssl_credentials()
+        if credentials is None:
+            channels = [
+                grpc.insecure_channel(address, options, compression)
+                for _ in range(size)
+            ]
+        else:
+            channels = [
+                grpc.secure_channel(address, credentials, options, compression)
+                for _ in range(size)
+            ]
+        return cls(channels)
+
+    @classmethod
+    def shared(
+        cls, address: str, size: int = DEFAULT_SIZE, secure: bool = False
+    ) -> "ChannelPool":
+        """
+        Get pool of channels to the node shared by the whole process
+
+        The pool is created with default options on first use and returned to
+        every later caller, so short-lived clients reuse established connections
+        instead of repeating the connection and TLS handshakes. Closing a shared
+        pool closes it for all of its users, the next call creates a new pool.
+
+        :param address: Address of gRPC node
+        :param size: Number of channels in the pool
+        :param secure: Use default TLS credentials
+
+        :return: ChannelPool
+        """
+        key = (address, size, secure)
+        with _SHARED_POOLS_LOCK:
+            pool = _SHARED_POOLS.get(key)
+            if pool is None:
+                pool = cls.create(address, size, secure=secure)
+                pool._shared_key = key  # pylint: disable=protected-access
+                _SHARED_POOLS[key] = pool
+        return pool
+
+    @property
+    def channels(self) -> List[grpc.Channel]:
+        """
+        Get channels of the pool.
+
+        :return: list of channels
+        """
+        return list(self._channels)
+
+    def next_index(self) -> int:
+        """
+        Get index of the next channel in round-robin order
+
+        :return: channel index
+        """
+        return next(self._counter) % len(self._channels)
+
+    def next(self) -> grpc.Channel:
+        """
+        Get the next channel in round-robin order
+
+        :return: gRPC channel
+        """
+        return self._channels[self.next_index()]
+
+    def unary_unary(self, *args, **kwargs) -> _RoundRobinMultiCallable:
+        """
+        Create unary-unary multi-callable spread over all channels
+
+        :param args: Positional arguments of grpc.Channel.unary_unary
+        :param kwargs: Keyword arguments of grpc.Channel.unary_unary
+
+        :return: Round-robin multi-callable
+        """
+        return _RoundRobinMultiCallable(
+            self, [ch.unary_unary(*args, **kwargs) for ch in self._channels]
+        )
+
+    def unary_stream(self, *args, **kwargs) -> _RoundRobinMultiCallable:
+        """
+        Create unary-stream multi-callable spread over all channels
+
+        :param args: Positional arguments of grpc.Channel.unary_stream
+        :param kwargs: Keyword arguments of grpc.Channel.unary_stream
+
+        :return: Round-robin multi-callable
+        """
+        return _RoundRobinMultiCallable(
+            self, [ch.unary_stream(*args, **kwargs) for ch in self._channels]
+        )
+
+    def stream_unary(self, *args, **kwargs) -> _RoundRobinMultiCallable:
+        """
+        Create stream-unary multi-callable spread over all channels
+
+        :param args: Positional arguments of grpc.Channel.stream_unary
+        :param kwargs: Keyword arguments of grpc.Channel.stream_unary
+
+        :return: Round-robin multi-callable
+        """
+        return _RoundRobinMultiCallable(
+            self, [ch.stream_unary(*args, **kwargs) for ch in self._channels]
+        )
+
+    def stream_stream(self, *args, **kwargs) -> _RoundRobinMultiCallable:
+        """
+        Create stream-stream multi-callable spread over all channels
+
+        :param args: Positional arguments of grpc.Channel.stream_stream
+        :param kwargs: Keyword arguments of grpc.Channel.stream_stream
+
+        :return: Round-robin multi-callable
+        """
+        return _RoundRobinMultiCallable(
+            self, [ch.stream_stream(*args, **kwargs) for ch in self._channels]
+        )
+
+    def close(self):
+        """Close all channels of the pool."""
+        if self._shared_key is not None:
+            # Later callers of shared() must not get the closed channels
+            with _SHARED_POOLS_LOCK:
+                if _SHARED_POOLS.get(self._shared_key) is self:
+                    del _SHARED_POOLS[self._shared_key]
+        for channel in self._channels:
+            channel.close()
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
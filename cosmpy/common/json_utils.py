@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""JSON encoding and decoding helpers."""
+
+import json
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# orjson decodes integers outside of 64 bits as floats, such integers have at
+# least 19 digits so documents containing a run of 19 digits use the standard library
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+_LONG_DIGITS_STR = re.compile(r"\d{19}")
+
+
+def json_encode(data: Any) -> bytes:
+    """
+    Encode data as compact UTF-8 JSON
+
+    orjson is used when installed and the standard library is used for data it
+    can not encode, such as integers outside of 64 bits. Output of both is the same
+    except for NaN and infinity, which orjson encodes as null.
+
+    :param data: JSON serializable data
+
+    :return: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("UTF8")
+
+
+def json_decode(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON
+
+    orjson is used when installed unless the document may contain integers
+    outside of 64 bits, which are decoded without loss of precision by the standard library.
+
+    :param data: JSON document
+
+    :return: decoded data
+    """
+    if orjson is not None:
+        if isinstance(data, str):
+            has_long_ints = _LONG_DIGITS_STR.search(data) is not None
+        else:
+            has_long_ints = _LONG_DIGITS_BYTES.search(data) is not None
+        if not has_long_ints:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
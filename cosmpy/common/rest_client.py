@@ -25,11 +25,15 @@ from urllib.parse import urlencode
 import requests
 from google.protobuf.json_format import MessageToDict
 from google.protobuf.message import Message
+from requests.adapters import HTTPAdapter
 
 
 class RestClient:
     """REST api client."""
 
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
+
     def __init__(self, rest_address: str):
         """
         Create REST api client
@@ -37,6 +41,15 @@ class RestClient:
         :param rest_address: Address of REST node
         """
         self._session = requests.session()
+        # Keep connections alive and pooled so concurrent requests reuse them
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=0,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"Connection": "keep-alive"})
         self.rest_address = rest_address
 
     def get(
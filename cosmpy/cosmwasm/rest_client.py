@@ -24,6 +24,7 @@ import json
 
 from google.protobuf.json_format import Parse, ParseDict
 
+from cosmpy.common.json_utils import json_decode
 from cosmpy.common.rest_client import RestClient
 from cosmpy.common.types import JSONLike
 from cosmpy.cosmwasm.interface import CosmWasm
@@ -201,7 +202,7 @@ class CosmWasmRestClient(CosmWasm):
         :param response: raw/smart contract state response
         :return: Fixed response in form of dict
         """
-        dict_response = json.loads(response)
+        dict_response = json_decode(response)
         dict_response["data"] = base64.b64encode(
             json.dumps(dict_response["data"]).encode("UTF8")
         ).decode()
@@ -216,7 +217,7 @@ class CosmWasmRestClient(CosmWasm):
         :param response: raw/smart contract state response
         :return: Fixed response in form of dict
         """
-        dict_response = json.loads(response)
+        dict_response = json_decode(response)
         for entry in dict_response["entries"]:
             entry["msg"] = base64.b64encode(
                 json.dumps(entry["msg"]).encode("UTF8")
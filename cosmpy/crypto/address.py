@@ -19,6 +19,7 @@
 
 """Address of the Crypto package."""
 
+import functools
 from typing import Optional, Union
 
 import bech32
@@ -36,6 +37,19 @@ def _to_bech32(prefix: str, data: bytes) -> str:
     return bech32.bech32_encode(prefix, data_base5)
 
 
+@functools.lru_cache(maxsize=1024)
+def _from_bech32(value: str) -> bytes:
+    _, data_base5 = bech32.bech32_decode(value)
+    if data_base5 is None:
+        raise RuntimeError("Unable to parse address")
+
+    data_base8 = bech32.convertbits(data_base5, 5, 8, False)
+    if data_base8 is None:
+        raise RuntimeError("Unable to parse address")  # pragma: no cover
+
+    return bytes(data_base8)
+
+
 class Address:
     """Address class."""
 
@@ -49,15 +63,8 @@ class Address:
             prefix = DEFAULT_PREFIX
 
         if isinstance(value, str):
-            _, data_base5 = bech32.bech32_decode(value)
-            if data_base5 is None:
-                raise RuntimeError("Unable to parse address")
-
-            data_base8 = bech32.convertbits(data_base5, 5, 8, False)
-            if data_base8 is None:
-                raise RuntimeError("Unable to parse address")  # pragma: no cover
-
-            self._address = bytes(data_base8)
+            # Same addresses are parsed repeatedly, e.g. on every transaction
+            self._address = _from_bech32(value)
             self._display = value
 
         elif isinstance(value, bytes):
@@ -25,6 +25,7 @@ from typing import Any, Dict, List
 
 from google.protobuf.json_format import Parse, ParseDict
 
+from cosmpy.common.json_utils import json_decode
 from cosmpy.common.rest_client import RestClient
 from cosmpy.protos.cosmos.crypto.secp256k1.keys_pb2 import (  # noqa: F401  # pylint: disable=unused-import
     PubKey as ProtoPubKey,
@@ -48,6 +49,14 @@ from cosmpy.tx.interface import TxInterface
 
 # Unused imports are required to make sure that related types get generated - Parse and ParseDict fail without them
 
+# CosmWasm messages with JSON "msg" field returned as dict by REST api
+_WASM_MSG_TYPE_URLS = frozenset(
+    (
+        "/cosmwasm.wasm.v1.MsgInstantiateContract",
+        "/cosmwasm.wasm.v1.MsgExecuteContract",
+    )
+)
+
 
 class TxRestClient(TxInterface):
     """Tx REST client."""
@@ -84,7 +93,7 @@ class TxRestClient(TxInterface):
         response = self.rest_client.get(f"{self.API_URL}/txs/{request.hash}")
 
         # JSON in JSON in case of CosmWasm messages workaround
-        dict_response = json.loads(response)
+        dict_response = json_decode(response)
         self._fix_messages(dict_response["tx"]["body"]["messages"])
         self._fix_messages(dict_response["tx_response"]["tx"]["body"]["messages"])
 
@@ -110,7 +119,7 @@ class TxRestClient(TxInterface):
         response = self.rest_client.get(f"{self.API_URL}/txs", request)
 
         # JSON in JSON in case of CosmWasm messages workaround
-        dict_response = json.loads(response)
+        dict_response = json_decode(response)
         for tx in dict_response["txs"]:
             self._fix_messages(tx["body"]["messages"])
 
@@ -127,11 +136,7 @@ class TxRestClient(TxInterface):
         :param messages: List of message in Tx response
         """
         for message in messages:
-            if message["@type"] == "/cosmwasm.wasm.v1.MsgInstantiateContract":
-                message["msg"] = base64.b64encode(
-                    json.dumps(message["msg"]).encode("UTF8")
-                ).decode()
-            if message["@type"] == "/cosmwasm.wasm.v1.MsgExecuteContract":
+            if message["@type"] in _WASM_MSG_TYPE_URLS:
                 message["msg"] = base64.b64encode(
                     json.dumps(message["msg"]).encode("UTF8")
                 ).decode()
@@ -27,19 +27,46 @@ _.SupplyOf  # unused method (./bank/interface.py:75)
 _.Params  # unused method (./bank/interface.py:85)
 _.DenomMetadata  # unused method (./bank/interface.py:95)
 _.DenomsMetadata  # unused method (./bank/interface.py:107)
-_.AllBalances  # unused method (./bank/rest_client.py:70)
-_.TotalSupply  # unused method (./bank/rest_client.py:83)
-_.SupplyOf  # unused method (./bank/rest_client.py:94)
-_.Params  # unused method (./bank/rest_client.py:105)
-_.DenomMetadata  # unused method (./bank/rest_client.py:116)
-_.DenomsMetadata  # unused method (./bank/rest_client.py:129)
-_.get_balance  # unused method (./clients/cosmwasm_client.py:63)
-_.query_contract_state  # unused method (./clients/cosmwasm_client.py:98)
-SigningCosmWasmClient  # unused class (./clients/signing_cosmwasm_client.py:58)
-_.send_tokens  # unused method (./clients/signing_cosmwasm_client.py:280)
-_.deploy_contract  # unused method (./clients/signing_cosmwasm_client.py:297)
-_.instantiate_contract  # unused method (./clients/signing_cosmwasm_client.py:319)
-_.execute_contract  # unused method (./clients/signing_cosmwasm_client.py:353)
+_.AllBalances  # unused method (./bank/rest_client.py:72)
+_.TotalSupply  # unused method (./bank/rest_client.py:85)
+_.SupplyOf  # unused method (./bank/rest_client.py:96)
+_.Params  # unused method (./bank/rest_client.py:107)
+_.DenomMetadata  # unused method (./bank/rest_client.py:118)
+_.DenomsMetadata  # unused method (./bank/rest_client.py:131)
+_.get_balance  # unused method (./clients/async_cosmwasm_client.py:69)
+_.query_contract_state  # unused method (./clients/async_cosmwasm_client.py:113)
+AsyncSigningCosmWasmClient  # unused class (./clients/async_signing_cosmwasm_client.py:42)
+_.submit_tx  # unused method (./clients/async_signing_cosmwasm_client.py:128)
+_.send_tokens  # unused method (./clients/async_signing_cosmwasm_client.py:139)
+_.get_balance  # unused method (./clients/cosmwasm_client.py:111)
+_.get_balances  # unused method (./clients/cosmwasm_client.py:135)
+_.query_contract_state  # unused method (./clients/cosmwasm_client.py:195)
+mtime_ns  # unused variable (./clients/signing_cosmwasm_client.py:85)
+_.submit_tx  # unused method (./clients/signing_cosmwasm_client.py:285)
+_.get_packed_store_msgs  # unused method (./clients/signing_cosmwasm_client.py:382)
+_.send_tokens  # unused method (./clients/signing_cosmwasm_client.py:467)
+_.send_tokens_batch  # unused method (./clients/signing_cosmwasm_client.py:484)
+_.deploy_contract  # unused method (./clients/signing_cosmwasm_client.py:525)
+_.instantiate_contract  # unused method (./clients/signing_cosmwasm_client.py:547)
+_.execute_contract  # unused method (./clients/signing_cosmwasm_client.py:581)
+_.shared  # unused method (./common/channel_pool.py:163)
+exc_tb  # unused variable (./common/channel_pool.py:283)
+exc_type  # unused variable (./common/channel_pool.py:283)
+exc_val  # unused variable (./common/channel_pool.py:283)
+_.ContractInfo  # unused method (./cosmwasm/interface.py:47)
+_.ContractHistory  # unused method (./cosmwasm/interface.py:59)
+_.ContractsByCode  # unused method (./cosmwasm/interface.py:71)
+_.AllContractState  # unused method (./cosmwasm/interface.py:83)
+_.RawContractState  # unused method (./cosmwasm/interface.py:95)
+_.Code  # unused method (./cosmwasm/interface.py:119)
+_.Codes  # unused method (./cosmwasm/interface.py:129)
+_.ContractInfo  # unused method (./cosmwasm/rest_client.py:64)
+_.ContractHistory  # unused method (./cosmwasm/rest_client.py:79)
+_.ContractsByCode  # unused method (./cosmwasm/rest_client.py:97)
+_.AllContractState  # unused method (./cosmwasm/rest_client.py:112)
+_.RawContractState  # unused method (./cosmwasm/rest_client.py:127)
+_.Code  # unused method (./cosmwasm/rest_client.py:171)
+_.Codes  # unused method (./cosmwasm/rest_client.py:185)
 _.public_key_hex  # unused property (./crypto/keypairs.py:64)
 _.private_key_hex  # unused property (./crypto/keypairs.py:156)
 _.Validators  # unused method (./staking/interface.py:59)
@@ -71,9 +98,9 @@ _.DelegatorValidator  # unused method (./staking/rest_client.py:165)
 _.HistoricalInfo  # unused method (./staking/rest_client.py:174)
 _.Pool  # unused method (./staking/rest_client.py:183)
 _.Params  # unused method (./staking/rest_client.py:188)
-_.body_bytes  # unused attribute (./tx/__init__.py:46)
-_.auth_info_bytes  # unused attribute (./tx/__init__.py:47)
+_.body_bytes  # unused attribute (./tx/__init__.py:43)
+_.auth_info_bytes  # unused attribute (./tx/__init__.py:44)
 _.Simulate  # unused method (./tx/interface.py:30)
 _.GetTxsEvent  # unused method (./tx/interface.py:42)
-_.Simulate  # unused method (./tx/rest_client.py:56)
-_.GetTxsEvent  # unused method (./tx/rest_client.py:94)
+_.Simulate  # unused method (./tx/rest_client.py:74)
+_.GetTxsEvent  # unused method (./tx/rest_client.py:112)
@@ -55,6 +55,7 @@ setup(
     install_requires=[
         "ecdsa",
         "bech32",
+        "certifi",
         "requests",
         "google-api-python-client",
         "protobuf",
@@ -81,6 +82,7 @@ setup(
             "grpcio-tools<=1.32.0",
         ],
         "test": ["coverage", "pytest"],
+        "speedups": ["orjson", "isal"],
     },
     project_urls={
         "Bug Reports": "https://github.com/fetchai/cosmpy/issues",
@@ -20,10 +20,14 @@
 """Helpers methods and classes for testing."""
 
 from typing import List, Optional
+from unittest.mock import Mock
 
+import grpc
 from google.protobuf.descriptor import Descriptor
 
 from cosmpy.common.rest_client import RestClient
+from cosmpy.protos.cosmos.auth.v1beta1.auth_pb2 import BaseAccount
+from cosmpy.protos.cosmos.auth.v1beta1.query_pb2 import QueryAccountResponse
 
 
 class MockRestClient(RestClient):
@@ -57,3 +61,50 @@ class MockRestClient(RestClient):
         self.last_request = request
 
         return self.content
+
+
+class MockRpcError(grpc.RpcError):
+    """Mock gRPC error with status code"""
+
+    def __init__(self, status_code: grpc.StatusCode, trailing_metadata=()):
+        """
+        Create mock gRPC error
+
+        :param status_code: Status code of the error
+        :param trailing_metadata: Trailing metadata of the call
+        """
+        super().__init__()
+        self.status_code = status_code
+        self.metadata = trailing_metadata
+
+    def code(self) -> grpc.StatusCode:
+        """Get status code of the error."""
+        return self.status_code
+
+    def trailing_metadata(self):
+        """Get trailing metadata of the call."""
+        return self.metadata
+
+
+class MockAsyncFunction(Mock):
+    """Mock of coroutine function, calls are recorded when awaited"""
+
+    def __call__(self, *args, **kwargs):
+        """Create coroutine returning result of the mock call."""
+
+        async def call():
+            return Mock.__call__(self, *args, **kwargs)
+
+        return call()
+
+
+def account_response(
+    address: str, sequence: int, account_number: int = 0
+) -> QueryAccountResponse:
+    """Create account query response."""
+    response = QueryAccountResponse()
+    response.account.Pack(
+        BaseAccount(address=address, account_number=account_number, sequence=sequence),
+        type_url_prefix="/",
+    )
+    return response
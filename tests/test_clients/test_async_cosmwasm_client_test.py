@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the asynchronous CosmWasm client module of the Clients Package."""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import grpc
+
+from cosmpy.clients.async_cosmwasm_client import AsyncCosmWasmClient
+from cosmpy.protos.cosmos.bank.v1beta1.query_pb2 import QueryBalanceResponse
+from cosmpy.protos.cosmos.base.abci.v1beta1.abci_pb2 import TxResponse
+from cosmpy.protos.cosmos.base.v1beta1.coin_pb2 import Coin
+from cosmpy.protos.cosmos.tx.v1beta1.service_pb2 import GetTxResponse
+from cosmpy.protos.cosmwasm.wasm.v1.query_pb2 import QuerySmartContractStateResponse
+from tests.helpers import MockAsyncFunction, MockRpcError, account_response
+
+
+class AsyncCosmWasmClientTestCase(unittest.TestCase):
+    """Test case of asynchronous CosmWasm client module."""
+
+    def setUp(self):
+        """Set up test case."""
+
+        async def create_client():
+            return AsyncCosmWasmClient(grpc.aio.insecure_channel("localhost:9090"))
+
+        self.client = asyncio.run(create_client())
+
+    def test_get_balance(self):
+        """Test get balance for the positive result."""
+        expected_response = QueryBalanceResponse(
+            balance=Coin(denom="stake", amount="1234")
+        )
+        self.client.bank_client.Balance = MockAsyncFunction(
+            return_value=expected_response
+        )
+
+        response = asyncio.run(self.client.get_balance("account", "stake"))
+
+        assert response == expected_response
+        request = self.client.bank_client.Balance.call_args[0][0]
+        assert request.address == "account"
+        assert request.denom == "stake"
+
+    def test_query_accounts_data(self):
+        """Test that account data of multiple accounts are queried."""
+        addresses = ["address_1", "address_2"]
+        self.client.auth_client.Account = MockAsyncFunction(
+            side_effect=lambda request: account_response(
+                request.address, addresses.index(request.address)
+            )
+        )
+
+        accounts = asyncio.run(self.client.query_accounts_data(addresses))
+
+        assert [account.address for account in accounts] == addresses
+        assert [account.sequence for account in accounts] == [0, 1]
+
+    def test_query_contract_state(self):
+        """Test query contract state for the positive result."""
+        self.client.wasm_client.SmartContractState = MockAsyncFunction(
+            return_value=QuerySmartContractStateResponse(data=b'{"balance":"1"}')
+        )
+
+        response = asyncio.run(
+            self.client.query_contract_state("fetchcontractaddress", {})
+        )
+
+        assert response == {"balance": "1"}
+        request = self.client.wasm_client.SmartContractState.call_args[0][0]
+        assert request.query_data == b"{}"
+
+    def test_wait_for_txs_concurrently(self):
+        """Test that receipts of multiple transactions are polled concurrently."""
+        pending = {"hash_1": 1, "hash_2": 2}
+
+        async def get_tx(request):
+            if pending[request.hash] > 0:
+                pending[request.hash] -= 1
+                raise MockRpcError(grpc.StatusCode.NOT_FOUND)
+            return GetTxResponse(tx_response=TxResponse(txhash=request.hash))
+
+        self.client.tx_client.GetTx = get_tx
+
+        async def wait_all():
+            return await asyncio.gather(
+                *[self.client.wait_for_tx(txhash, 60) for txhash in pending]
+            )
+
+        with patch("asyncio.sleep", MockAsyncFunction()) as sleep_mock:
+            responses = asyncio.run(wait_all())
+
+        assert [res.tx_response.txhash for res in responses] == ["hash_1", "hash_2"]
+        assert sleep_mock.call_count == 3
+
+    def test_wait_for_tx_not_retried(self):
+        """Test that non-transient errors are raised without polling again."""
+        self.client.tx_client.GetTx = MockAsyncFunction(
+            side_effect=MockRpcError(grpc.StatusCode.INVALID_ARGUMENT)
+        )
+
+        self.assertRaises(
+            grpc.RpcError, asyncio.run, self.client.wait_for_tx("hash", 60)
+        )
+        assert self.client.tx_client.GetTx.call_count == 1
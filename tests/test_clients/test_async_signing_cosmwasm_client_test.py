@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the asynchronous CosmWasm signing client module of the Clients Package."""
+
+import asyncio
+import unittest
+
+import grpc
+
+from cosmpy.clients.async_signing_cosmwasm_client import AsyncSigningCosmWasmClient
+from cosmpy.crypto.address import Address
+from cosmpy.crypto.keypairs import PrivateKey
+from cosmpy.protos.cosmos.auth.v1beta1.query_pb2 import QueryAccountResponse
+from cosmpy.protos.cosmos.base.abci.v1beta1.abci_pb2 import TxResponse
+from cosmpy.protos.cosmos.base.v1beta1.coin_pb2 import Coin
+from cosmpy.protos.cosmos.tx.v1beta1.service_pb2 import (
+    BroadcastMode,
+    BroadcastTxResponse,
+    GetTxResponse,
+)
+from cosmpy.protos.cosmos.tx.v1beta1.tx_pb2 import Tx
+from tests.helpers import MockAsyncFunction, MockRpcError, account_response
+
+PRIVATE_KEY = PrivateKey(
+    bytes.fromhex("deadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeef")
+)
+ADDRESS_PK = Address(PRIVATE_KEY)
+OTHER_PRIVATE_KEY = PrivateKey(
+    bytes.fromhex("beefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeefdead")
+)
+ADDRESS_OTHER = Address(OTHER_PRIVATE_KEY)
+CHAIN_ID = "testing"
+ACCOUNT_NUMBER = 5
+COINS = [Coin(amount="1234", denom="stake")]
+
+
+def signer_account_response(request) -> QueryAccountResponse:
+    """Create account query response with sequence derived from the address."""
+    sequence = 1 if request.address == str(ADDRESS_PK) else 2
+    return account_response(request.address, sequence, ACCOUNT_NUMBER)
+
+
+class AsyncSigningCosmWasmClientTestCase(unittest.TestCase):
+    """Test case of asynchronous CosmWasm signing client module."""
+
+    def setUp(self):
+        """Set up test case."""
+
+        async def create_client():
+            return AsyncSigningCosmWasmClient(
+                PRIVATE_KEY, grpc.aio.insecure_channel("localhost:9090"), CHAIN_ID
+            )
+
+        self.client = asyncio.run(create_client())
+        self.client.auth_client.Account = MockAsyncFunction(
+            side_effect=signer_account_response
+        )
+
+    def test_generate_tx_multiple_signers(self):
+        """Test that account data of all signers are queried."""
+        tx = asyncio.run(
+            self.client.generate_tx(
+                [],
+                [ADDRESS_PK, ADDRESS_OTHER],
+                [PRIVATE_KEY.public_key_bytes, OTHER_PRIVATE_KEY.public_key_bytes],
+                COINS,
+            )
+        )
+
+        assert self.client.auth_client.Account.call_count == 2
+        assert [info.sequence for info in tx.auth_info.signer_infos] == [1, 2]
+        assert list(tx.auth_info.fee.amount) == COINS
+
+    def test_send_tokens(self):
+        """Test send tokens method with positive result."""
+        self.client.tx_client.BroadcastTx = MockAsyncFunction(
+            return_value=BroadcastTxResponse(tx_response=TxResponse(txhash="hash"))
+        )
+        self.client.tx_client.GetTx = MockAsyncFunction(
+            return_value=GetTxResponse(tx_response=TxResponse(txhash="hash"))
+        )
+
+        result = asyncio.run(self.client.send_tokens(ADDRESS_OTHER, COINS))
+
+        assert result.tx_response.txhash == "hash"
+        assert self.client.account_number == ACCOUNT_NUMBER
+        # Account is queried for the sequence and once for the account number
+        assert self.client.auth_client.Account.call_count == 2
+
+        request = self.client.tx_client.BroadcastTx.call_args[0][0]
+        tx = Tx.FromString(request.tx_bytes)
+        assert len(tx.body.messages) == 1
+        assert len(tx.signatures) == 1
+
+    def test_broadcast_tx_block_mode(self):
+        """Test that receipt is not polled in block broadcast mode."""
+        self.client.broadcast_mode = BroadcastMode.BROADCAST_MODE_BLOCK
+        tx_response = TxResponse(txhash="hash", height=10)
+        self.client.tx_client.BroadcastTx = MockAsyncFunction(
+            return_value=BroadcastTxResponse(tx_response=tx_response)
+        )
+        # Indexer may not have caught up with the committed block yet
+        self.client.tx_client.GetTx = MockAsyncFunction(
+            side_effect=MockRpcError(grpc.StatusCode.NOT_FOUND)
+        )
+        tx = Tx()
+        tx.body.memo = "memo"
+
+        result = asyncio.run(self.client.broadcast_tx(tx))
+
+        assert result == GetTxResponse(tx=tx, tx_response=tx_response)
+        self.client.tx_client.GetTx.assert_not_called()
+
+    def test_submit_tx(self):
+        """Test that submitted transaction hash is returned without polling the receipt."""
+        self.client.tx_client.BroadcastTx = MockAsyncFunction(
+            return_value=BroadcastTxResponse(tx_response=TxResponse(txhash="hash"))
+        )
+        self.client.tx_client.GetTx = MockAsyncFunction()
+
+        assert asyncio.run(self.client.submit_tx(Tx())) == "hash"
+        self.client.tx_client.GetTx.assert_not_called()
+
+    def test_broadcast_tx_fail(self):
+        """Test broadcast Tx with negative result."""
+        self.client.tx_client.BroadcastTx = MockAsyncFunction(
+            return_value=BroadcastTxResponse(tx_response=TxResponse(code=1))
+        )
+
+        self.assertRaises(RuntimeError, asyncio.run, self.client.broadcast_tx(Tx()))
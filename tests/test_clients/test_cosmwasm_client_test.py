@@ -21,14 +21,17 @@
 
 import json
 import unittest
+from unittest.mock import Mock, patch
 
+import grpc
 from google.protobuf.json_format import ParseDict
 
 from cosmpy.clients.cosmwasm_client import CosmWasmClient
 from cosmpy.protos.cosmos.auth.v1beta1.auth_pb2 import BaseAccount
 from cosmpy.protos.cosmos.auth.v1beta1.query_pb2 import QueryAccountResponse
 from cosmpy.protos.cosmos.bank.v1beta1.query_pb2 import QueryBalanceResponse
-from tests.helpers import MockRestClient
+from cosmpy.protos.cosmos.base.v1beta1.coin_pb2 import Coin
+from tests.helpers import MockRestClient, MockRpcError
 
 
 class CosmWasmClientTestCase(unittest.TestCase):
@@ -50,6 +53,76 @@ class CosmWasmClientTestCase(unittest.TestCase):
             mock_rest_client.last_base_url == "/cosmos/bank/v1beta1/balances/account/"
         )
 
+    @staticmethod
+    def test_get_balance_cached():
+        """Test that balance is reused from cache within its TTL."""
+
+        content = {"balance": {"denom": "stake", "amount": "1234"}}
+        wasm_client = CosmWasmClient(MockRestClient(json.dumps(content)))
+        wasm_client.bank_client = Mock(wraps=wasm_client.bank_client)
+
+        first = wasm_client.get_balance("account", "denom", cache_ttl=60)
+        second = wasm_client.get_balance("account", "denom", cache_ttl=60)
+        assert first == second
+        assert wasm_client.bank_client.Balance.call_count == 1
+
+        # Caching is disabled by default
+        wasm_client.get_balance("account", "denom")
+        assert wasm_client.bank_client.Balance.call_count == 2
+
+        wasm_client.clear_cache()
+        third = wasm_client.get_balance("account", "denom", cache_ttl=60)
+        assert wasm_client.bank_client.Balance.call_count == 3
+
+        # Modifying returned balance does not change the cached one
+        third.balance.amount = "0"
+        cached = wasm_client.get_balance("account", "denom", cache_ttl=60)
+        assert cached.balance.amount == "1234"
+        assert wasm_client.bank_client.Balance.call_count == 3
+
+    @staticmethod
+    def test_cache_bounded():
+        """Test that cache evicts least recently used entries when full."""
+        # pylint: disable=protected-access
+        wasm_client = CosmWasmClient(MockRestClient(b""))
+        wasm_client.MAX_CACHE_SIZE = 3
+        query = Mock(return_value="result")
+
+        for key in range(3):
+            wasm_client._cached((key,), 60, query)
+        # Use the oldest entry so that the second one is evicted next
+        wasm_client._cached((0,), 60, query)
+        wasm_client._cached((3,), 60, query)
+
+        assert list(wasm_client._cache) == [(2,), (0,), (3,)]
+        assert query.call_count == 4
+
+        for key in range(4, 3000):
+            wasm_client._cached((key,), 60, query)
+        assert len(wasm_client._cache) == 3
+
+    @staticmethod
+    def test_get_balances_concurrently():
+        """Test that balances are queried concurrently using gRPC futures."""
+        addresses = ["address_1", "address_2"]
+
+        def future(request):
+            result = Mock()
+            result.result.return_value = QueryBalanceResponse(
+                balance=Coin(denom=request.denom, amount=request.address[-1])
+            )
+            return result
+
+        wasm_client = CosmWasmClient(MockRestClient(b""))
+        wasm_client.bank_client = Mock()
+        wasm_client.bank_client.Balance.future.side_effect = future
+
+        responses = wasm_client.get_balances(addresses, "stake")
+
+        assert [res.balance.amount for res in responses] == ["1", "2"]
+        assert all(res.balance.denom == "stake" for res in responses)
+        wasm_client.bank_client.Balance.assert_not_called()
+
     @staticmethod
     def test_query_account_data():
         """Test query account data for the positive result."""
@@ -79,6 +152,91 @@ class CosmWasmClientTestCase(unittest.TestCase):
         assert response == account
         assert mock_rest_client.last_base_url == "/cosmos/auth/v1beta1/accounts/address"
 
+    def test_query_account_data_unexpected_type(self):
+        """Test that account of other type than BaseAccount is rejected."""
+        account_response = QueryAccountResponse()
+        account_response.account.Pack(
+            QueryBalanceResponse(), type_url_prefix="type.googleapis.com/"
+        )
+
+        wasm_client = CosmWasmClient(MockRestClient(b""))
+        wasm_client.auth_client = Mock()
+        wasm_client.auth_client.Account.return_value = account_response
+
+        self.assertRaises(TypeError, wasm_client.query_account_data, "address")
+
+    @staticmethod
+    def test_query_accounts_data_concurrently():
+        """Test that accounts are queried concurrently using gRPC futures."""
+
+        addresses = ["address_1", "address_2"]
+        account_responses = {}
+        for sequence, address in enumerate(addresses):
+            account_response = QueryAccountResponse()
+            account_response.account.Pack(
+                BaseAccount(address=address, sequence=sequence), type_url_prefix="/"
+            )
+            account_responses[address] = account_response
+
+        def future(request):
+            result = Mock()
+            result.result.return_value = account_responses[request.address]
+            return result
+
+        wasm_client = CosmWasmClient(MockRestClient(b""))
+        wasm_client.auth_client = Mock()
+        wasm_client.auth_client.Account.future.side_effect = future
+
+        accounts = wasm_client.query_accounts_data(addresses)
+
+        assert [account.address for account in accounts] == addresses
+        assert [account.sequence for account in accounts] == [0, 1]
+        wasm_client.auth_client.Account.assert_not_called()
+
+    @staticmethod
+    def test_query_accounts_data_retries_unavailable():
+        """Test that concurrent account queries failing as unavailable are retried."""
+        account_response = QueryAccountResponse()
+        account_response.account.Pack(
+            BaseAccount(address="address_2", sequence=2), type_url_prefix="/"
+        )
+        failed = Mock()
+        failed.result.side_effect = MockRpcError(grpc.StatusCode.UNAVAILABLE)
+        succeeded = Mock()
+        succeeded.result.return_value = account_response
+
+        wasm_client = CosmWasmClient(MockRestClient(b""))
+        wasm_client.auth_client = Mock()
+        wasm_client.auth_client.Account.future.side_effect = [succeeded, failed]
+        wasm_client.auth_client.Account.side_effect = [
+            MockRpcError(grpc.StatusCode.UNAVAILABLE),
+            account_response,
+        ]
+
+        with patch("time.sleep") as sleep_mock:
+            accounts = wasm_client.query_accounts_data(["address_2", "address_2"])
+
+        assert [account.sequence for account in accounts] == [2, 2]
+        assert wasm_client.auth_client.Account.call_count == 2
+        assert sleep_mock.call_count == 2
+
+    def test_query_accounts_data_non_transient_error(self):
+        """Test that concurrent account queries are not retried on other errors."""
+        failed = Mock()
+        failed.result.side_effect = MockRpcError(grpc.StatusCode.INVALID_ARGUMENT)
+
+        wasm_client = CosmWasmClient(MockRestClient(b""))
+        wasm_client.auth_client = Mock()
+        wasm_client.auth_client.Account.future.return_value = failed
+
+        with patch("time.sleep") as sleep_mock:
+            self.assertRaises(
+                grpc.RpcError, wasm_client.query_accounts_data, ["address"]
+            )
+
+        wasm_client.auth_client.Account.assert_not_called()
+        sleep_mock.assert_not_called()
+
     @staticmethod
     def test_query_contract_state():
         """Test query contract state for the positive result."""
@@ -95,3 +253,29 @@ class CosmWasmClientTestCase(unittest.TestCase):
             mock_rest_client.last_base_url
             == "/wasm/v1/contract/fetchcontractaddress/smart/e30="
         )
+
+    @staticmethod
+    def test_query_contract_state_cached():
+        """Test that contract state is cached per contract and query message."""
+
+        mock_rest_client = MockRestClient(b'{"data": {"balance":"1"}}')
+        wasm_client = CosmWasmClient(mock_rest_client)
+        wasm_client.wasm_client = Mock(wraps=wasm_client.wasm_client)
+
+        wasm_client.query_contract_state("fetchcontract", {}, cache_ttl=60)
+        wasm_client.query_contract_state("fetchcontract", {}, cache_ttl=60)
+        assert wasm_client.wasm_client.SmartContractState.call_count == 1
+
+        response = wasm_client.query_contract_state(
+            "fetchcontract", {"a": 1}, cache_ttl=60
+        )
+        assert response == {"balance": "1"}
+        assert wasm_client.wasm_client.SmartContractState.call_count == 2
+
+        # Modifying returned state does not change the cached one
+        response["balance"] = "0"
+        response = wasm_client.query_contract_state(
+            "fetchcontract", {"a": 1}, cache_ttl=60
+        )
+        assert response == {"balance": "1"}
+        assert wasm_client.wasm_client.SmartContractState.call_count == 2
@@ -28,21 +28,32 @@ import unittest
 from typing import Optional
 from unittest.mock import patch
 
+import grpc
+from google.protobuf.any_pb2 import Any as ProtoAny
 from google.protobuf.json_format import MessageToDict, ParseDict
 
 from cosmpy.auth.interface import Auth
-from cosmpy.clients.signing_cosmwasm_client import SigningCosmWasmClient
+from cosmpy.clients.signing_cosmwasm_client import (
+    SigningCosmWasmClient,
+    _build_tx,
+    _pack,
+    gzip_module,
+)
 from cosmpy.crypto.address import Address
 from cosmpy.crypto.keypairs import PrivateKey
+from cosmpy.protos.cosmos.auth.v1beta1.auth_pb2 import BaseAccount
 from cosmpy.protos.cosmos.auth.v1beta1.query_pb2 import (
     QueryAccountRequest,
     QueryAccountResponse,
     QueryParamsRequest,
     QueryParamsResponse,
 )
+from cosmpy.protos.cosmos.bank.v1beta1.tx_pb2 import MsgSend
 from cosmpy.protos.cosmos.base.abci.v1beta1.abci_pb2 import TxResponse
 from cosmpy.protos.cosmos.base.v1beta1.coin_pb2 import Coin
+from cosmpy.protos.cosmos.tx.signing.v1beta1.signing_pb2 import SignMode
 from cosmpy.protos.cosmos.tx.v1beta1.service_pb2 import (
+    BroadcastMode,
     BroadcastTxRequest,
     BroadcastTxResponse,
     GetTxRequest,
@@ -53,8 +64,9 @@ from cosmpy.protos.cosmos.tx.v1beta1.service_pb2 import (
     SimulateResponse,
 )
 from cosmpy.protos.cosmos.tx.v1beta1.tx_pb2 import Tx
+from cosmpy.protos.cosmwasm.wasm.v1.tx_pb2 import MsgStoreCode
 from cosmpy.tx.interface import TxInterface
-from tests.helpers import MockRestClient
+from tests.helpers import MockRestClient, MockRpcError
 
 # Private key
 PRIVATE_KEY = PrivateKey(
@@ -86,7 +98,7 @@ COINS = [Coin(amount=AMOUNT, denom=DENOM)]
 
 # CosmWasm
 WASM_MSG = {"key": "value"}
-WASM_MSG_BASE64 = base64.b64encode(json.dumps(WASM_MSG).encode("UTF8")).decode()
+WASM_MSG_BASE64 = base64.b64encode(b'{"key":"value"}').decode()
 CODE_ID = 42
 CONTRACT_ADDRESS = "fetchcontractcontractcontractcontractcontrac"
 CONTRACT_FILENAME = "dummy_contract.wasm"
@@ -134,13 +146,23 @@ class MockAuth(Auth):
 class MockTx(TxInterface):
     """Mock Tx client"""
 
-    def __init__(self, response_code: int):
+    def __init__(
+        self,
+        response_code: int,
+        n_pending_polls: int = 0,
+        pending_error: Optional[Exception] = None,
+    ):
         """
         Create mock Tx client
 
         :param response_code: Code in GetTxResponse returned on GetTx call
+        :param n_pending_polls: Number of GetTx calls failing before Tx is available
+        :param pending_error: Error raised by failing GetTx calls
         """
         self.response_code = response_code
+        self.n_pending_polls = n_pending_polls
+        self.pending_error = pending_error or RuntimeError("Tx not found")
+        self.n_get_tx_calls = 0
         self.last_broadcast_tx_request: Optional[BroadcastTxRequest] = None
 
     def Simulate(self, request: SimulateRequest) -> SimulateResponse:
@@ -149,6 +171,9 @@ class MockTx(TxInterface):
 
     def GetTx(self, request: GetTxRequest) -> GetTxResponse:
         """GetTx fetches a tx by hash."""
+        self.n_get_tx_calls += 1
+        if self.n_get_tx_calls <= self.n_pending_polls:
+            raise self.pending_error
         return GetTxResponse()
 
     def BroadcastTx(self, request: BroadcastTxRequest) -> BroadcastTxResponse:
@@ -214,6 +239,18 @@ class CosmWasmClientTestCase(unittest.TestCase):
         )
         assert MessageToDict(msg) == expected_result
 
+    @staticmethod
+    def test_pack_matches_any_pack():
+        """Test that packing with cached type URL matches ProtoAny.Pack."""
+        msg = MsgSend(
+            from_address=str(ADDRESS_PK), to_address=str(ADDRESS_OTHER), amount=COINS
+        )
+        expected = ProtoAny()
+        expected.Pack(msg, type_url_prefix="/")
+
+        for _ in range(2):
+            assert _pack(msg) == expected
+
     def test_get_packed_init_msg(self):
         """Test correct generation of packed instantiate msg."""
         expected_result = {
@@ -261,6 +298,67 @@ class CosmWasmClientTestCase(unittest.TestCase):
         original_bytecode: bytes = gzip.decompress(zipped_bytecode)
         self.assertEqual(original_bytecode, CONTRACT_BYTECODE)
 
+    def test_get_packed_store_msg_cached(self):
+        """Test that compressed bytecode is reused until the file changes."""
+        with tempfile.NamedTemporaryFile(suffix=CONTRACT_FILENAME, delete=False) as tmp:
+            tmp.write(CONTRACT_BYTECODE)
+            tmp.flush()
+
+        try:
+            with patch(
+                "cosmpy.clients.signing_cosmwasm_client.gzip_module.compress",
+                wraps=gzip_module.compress,
+            ) as compress_mock:
+                first = self.signing_wasm_client.get_packed_store_msg(
+                    ADDRESS_PK, tmp.name
+                )
+                second = self.signing_wasm_client.get_packed_store_msg(
+                    ADDRESS_PK, tmp.name
+                )
+                assert first == second
+                assert compress_mock.call_count == 1
+
+                with open(tmp.name, "ab") as contract_file:
+                    contract_file.write(CONTRACT_BYTECODE)
+                third = self.signing_wasm_client.get_packed_store_msg(
+                    ADDRESS_PK, tmp.name
+                )
+                assert compress_mock.call_count == 2
+        finally:
+            os.unlink(tmp.name)
+
+        msg_store_code = MsgStoreCode()
+        third.Unpack(msg_store_code)
+        self.assertEqual(
+            gzip.decompress(msg_store_code.wasm_byte_code), CONTRACT_BYTECODE * 2
+        )
+
+    def test_get_packed_store_msgs(self):
+        """Test packing of multiple store msgs in the order of files."""
+        filenames = []
+        try:
+            for i in range(3):
+                with tempfile.NamedTemporaryFile(
+                    suffix=CONTRACT_FILENAME, delete=False
+                ) as tmp:
+                    tmp.write(CONTRACT_BYTECODE * (i + 1))
+                filenames.append(tmp.name)
+
+            msgs = self.signing_wasm_client.get_packed_store_msgs(ADDRESS_PK, filenames)
+        finally:
+            for filename in filenames:
+                os.unlink(filename)
+
+        assert len(msgs) == 3
+        for i, msg in enumerate(msgs):
+            msg_store_code = MsgStoreCode()
+            msg.Unpack(msg_store_code)
+            assert msg_store_code.sender == str(ADDRESS_PK)
+            self.assertEqual(
+                gzip.decompress(msg_store_code.wasm_byte_code),
+                CONTRACT_BYTECODE * (i + 1),
+            )
+
     def test_generate_tx(self):
         """Test correct generation of Tx."""
         expected_result = {
@@ -302,6 +400,24 @@ class CosmWasmClientTestCase(unittest.TestCase):
 
         assert MessageToDict(tx) == expected_result
 
+    @staticmethod
+    def test_build_tx_signer_infos_isolated():
+        """Test that signer infos do not share the cached packed public key or mode info."""
+        account = BaseAccount(sequence=SEQUENCE)
+        first = _build_tx([], [account], [PRIVATE_KEY.public_key_bytes], None, "", 1)
+        first_info = first.auth_info.signer_infos[0]
+        first_info.public_key.value = b""
+        first_info.mode_info.single.mode = SignMode.SIGN_MODE_UNSPECIFIED
+
+        second = _build_tx([], [account], [PRIVATE_KEY.public_key_bytes], None, "", 1)
+        second_info = second.auth_info.signer_infos[0]
+        assert MessageToDict(second_info.public_key) == {
+            "@type": "/cosmos.crypto.secp256k1.PubKey",
+            "key": PUBLIC_KEY_PK_BASE64,
+        }
+        assert second_info.mode_info.single.mode == SignMode.SIGN_MODE_DIRECT
+        assert second_info.sequence == SEQUENCE
+
     def test_sign_tx(self):
         """Test correct generation of Tx."""
         expected_result = {
@@ -375,6 +491,141 @@ class CosmWasmClientTestCase(unittest.TestCase):
         # Check if broadcasting fails
         self.assertRaises(RuntimeError, self.signing_wasm_client.broadcast_tx, tx, 0)
 
+    def test_broadcast_tx_polls_receipt(self):
+        """Test that broadcast Tx polls receipt until transaction is available."""
+        tx = self.signing_wasm_client.generate_tx([], [], [], COINS, LABEL, GAS_LIMIT)
+
+        mock_tx_client = MockTx(response_code=0, n_pending_polls=2)
+        self.signing_wasm_client.tx_client = mock_tx_client
+
+        with patch("time.sleep") as sleep_mock:
+            result = self.signing_wasm_client.broadcast_tx(tx, 60)
+
+        self.assertIsInstance(result, GetTxResponse)
+        assert mock_tx_client.n_get_tx_calls == 3
+        assert sleep_mock.call_count == 2
+        first_delay, second_delay = [c[0][0] for c in sleep_mock.call_args_list]
+        assert first_delay <= SigningCosmWasmClient.TX_POLL_INTERVAL
+        assert second_delay <= 2 * SigningCosmWasmClient.TX_POLL_INTERVAL
+
+    def test_broadcast_tx_receipt_timeout(self):
+        """Test that broadcast Tx fails if receipt is not available in time."""
+        tx = self.signing_wasm_client.generate_tx([], [], [], COINS, LABEL, GAS_LIMIT)
+
+        mock_tx_client = MockTx(response_code=0, n_pending_polls=1)
+        self.signing_wasm_client.tx_client = mock_tx_client
+
+        self.assertRaises(RuntimeError, self.signing_wasm_client.broadcast_tx, tx, 0)
+        assert mock_tx_client.n_get_tx_calls == 1
+
+    def test_broadcast_tx_polls_grpc_not_found(self):
+        """Test that broadcast Tx keeps polling while gRPC reports tx not found."""
+        tx = self.signing_wasm_client.generate_tx([], [], [], COINS, LABEL, GAS_LIMIT)
+
+        mock_tx_client = MockTx(
+            response_code=0,
+            n_pending_polls=1,
+            pending_error=MockRpcError(grpc.StatusCode.NOT_FOUND),
+        )
+        self.signing_wasm_client.tx_client = mock_tx_client
+
+        with patch("time.sleep"):
+            result = self.signing_wasm_client.broadcast_tx(tx, 60)
+
+        self.assertIsInstance(result, GetTxResponse)
+        assert mock_tx_client.n_get_tx_calls == 2
+
+    def test_broadcast_tx_grpc_error_not_retried(self):
+        """Test that non-transient gRPC errors are raised without polling again."""
+        tx = self.signing_wasm_client.generate_tx([], [], [], COINS, LABEL, GAS_LIMIT)
+
+        mock_tx_client = MockTx(
+            response_code=0,
+            n_pending_polls=1,
+            pending_error=MockRpcError(grpc.StatusCode.INVALID_ARGUMENT),
+        )
+        self.signing_wasm_client.tx_client = mock_tx_client
+
+        with patch("time.sleep") as sleep_mock:
+            self.assertRaises(
+                grpc.RpcError, self.signing_wasm_client.broadcast_tx, tx, 60
+            )
+
+        assert mock_tx_client.n_get_tx_calls == 1
+        sleep_mock.assert_not_called()
+
+    def test_account_cache(self):
+        """Test that cached signer accounts are reused and follow broadcasts."""
+        client = self.signing_wasm_client
+        client.account_cache_ttl = 60
+        try:
+            with patch.object(
+                client.auth_client, "Account", wraps=client.auth_client.Account
+            ) as account_mock:
+                tx = client.generate_tx(
+                    [], [ADDRESS_PK], [PRIVATE_KEY.public_key_bytes], COINS
+                )
+                client.generate_tx(
+                    [], [ADDRESS_PK], [PRIVATE_KEY.public_key_bytes], COINS
+                )
+                assert account_mock.call_count == 1
+
+                # Accepted Tx consumes the cached sequence
+                client.tx_client = MockTx(response_code=0)
+                client.broadcast_tx(tx)
+                tx = client.generate_tx(
+                    [], [ADDRESS_PK], [PRIVATE_KEY.public_key_bytes], COINS
+                )
+                assert tx.auth_info.signer_infos[0].sequence == SEQUENCE + 1
+                assert account_mock.call_count == 1
+
+                # Rejected Tx drops the cached account
+                client.tx_client = MockTx(response_code=1)
+                self.assertRaises(RuntimeError, client.broadcast_tx, tx, 0)
+                tx = client.generate_tx(
+                    [], [ADDRESS_PK], [PRIVATE_KEY.public_key_bytes], COINS
+                )
+                assert tx.auth_info.signer_infos[0].sequence == SEQUENCE
+                assert account_mock.call_count == 2
+        finally:
+            client.account_cache_ttl = 0.0
+            client._account_cache.clear()  # pylint: disable=protected-access
+
+    def test_submit_and_wait_for_tx(self):
+        """Test that transaction can be submitted and its receipt awaited later."""
+        tx = self.signing_wasm_client.generate_tx([], [], [], COINS, LABEL, GAS_LIMIT)
+
+        mock_tx_client = MockTx(response_code=0, n_pending_polls=1)
+        self.signing_wasm_client.tx_client = mock_tx_client
+
+        txhash = self.signing_wasm_client.submit_tx(tx)
+        assert mock_tx_client.n_get_tx_calls == 0
+
+        with patch("time.sleep"):
+            result = self.signing_wasm_client.wait_for_tx(txhash, 60)
+
+        self.assertIsInstance(result, GetTxResponse)
+        assert mock_tx_client.n_get_tx_calls == 2
+
+    def test_broadcast_tx_block_mode(self):
+        """Test that broadcast Tx in block mode does not poll the receipt."""
+        tx = self.signing_wasm_client.generate_tx([], [], [], COINS, LABEL, GAS_LIMIT)
+
+        mock_tx_client = MockTx(response_code=0)
+        self.signing_wasm_client.tx_client = mock_tx_client
+        self.signing_wasm_client.broadcast_mode = BroadcastMode.BROADCAST_MODE_BLOCK
+        try:
+            result = self.signing_wasm_client.broadcast_tx(tx)
+        finally:
+            self.signing_wasm_client.broadcast_mode = BroadcastMode.BROADCAST_MODE_SYNC
+
+        assert mock_tx_client.n_get_tx_calls == 0
+        assert result.tx == tx
+        assert (
+            mock_tx_client.last_broadcast_tx_request.mode
+            == BroadcastMode.BROADCAST_MODE_BLOCK
+        )
+
     def test_send_tokens(self):
         """Test send tokens method with positive result."""
 
@@ -391,6 +642,27 @@ class CosmWasmClientTestCase(unittest.TestCase):
         assert len(tx.body.messages) == 1
         assert tx.body.messages[0].type_url == "/cosmos.bank.v1beta1.MsgSend"
 
+    def test_send_tokens_batch(self):
+        """Test that transfers to multiple recipients are bundled into transactions."""
+
+        mock_tx_client = MockTx(response_code=0)
+        self.signing_wasm_client.tx_client = mock_tx_client
+
+        result = self.signing_wasm_client.send_tokens_batch(
+            [ADDRESS_OTHER, ADDRESS_OTHER, ADDRESS_OTHER], COINS, chunk_size=2
+        )
+
+        assert len(result) == 2
+        assert mock_tx_client.n_get_tx_calls == 2
+
+        # Last transaction contains the remaining transfer only
+        tx = Tx()
+        tx.ParseFromString(mock_tx_client.last_broadcast_tx_request.tx_bytes)
+
+        assert len(tx.body.messages) == 1
+        assert len(tx.auth_info.signer_infos) == 1
+        assert tx.auth_info.fee.gas_limit == SigningCosmWasmClient.DEFAULT_GAS_LIMIT
+
     def test_deploy_contract(self):
         """Test deploy contract method with positive result."""
 
@@ -496,3 +768,71 @@ class CosmWasmClientTestCase(unittest.TestCase):
 
         result = self.signing_wasm_client.get_contract_address(tx_response)
         assert result == CONTRACT_ADDRESS
+
+    def test_get_contract_address_any_position(self):
+        """Test get contract address when it is not the first event attribute."""
+
+        raw_log_dict = [
+            {
+                "events": [
+                    {
+                        "type": "message",
+                        "attributes": [
+                            {"key": "action", "value": "instantiate"},
+                            {"key": "module", "value": "wasm"},
+                        ],
+                    },
+                    {
+                        "type": "wasm",
+                        "attributes": [
+                            {"key": "code_id", "value": str(CODE_ID)},
+                            {"key": "_contract_address", "value": CONTRACT_ADDRESS},
+                        ],
+                    },
+                ]
+            }
+        ]
+
+        tx_response = GetTxResponse()
+        tx_response.tx_response.raw_log = json.dumps(raw_log_dict)
+
+        assert self.signing_wasm_client.get_contract_address(tx_response) == (
+            CONTRACT_ADDRESS
+        )
+        assert self.signing_wasm_client.get_code_id(tx_response) == CODE_ID
+
+    def test_get_code_id_unexpected_layout(self):
+        """Test get code id from raw log not following the standard layout."""
+
+        raw_log_dict = {
+            "logs": [{"attributes": [{"key": "code_id", "value": str(CODE_ID)}]}]
+        }
+
+        tx_response = GetTxResponse()
+        tx_response.tx_response.raw_log = json.dumps(raw_log_dict)
+
+        assert self.signing_wasm_client.get_code_id(tx_response) == CODE_ID
+
+    def test_get_contract_address_missing(self):
+        """Test that missing contract address raises an error."""
+
+        raw_log_dict = [
+            {
+                "events": [
+                    {
+                        "type": "message",
+                        "attributes": [{"key": "action", "value": "instantiate"}],
+                    }
+                ]
+            }
+        ]
+
+        tx_response = GetTxResponse()
+        tx_response.tx_response.raw_log = json.dumps(raw_log_dict)
+
+        self.assertRaises(
+            RuntimeError, self.signing_wasm_client.get_contract_address, tx_response
+        )
+        self.assertRaises(
+            RuntimeError, self.signing_wasm_client.get_code_id, tx_response
+        )
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for retry backoff helpers."""
+
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import grpc
+
+from cosmpy.common.backoff import backoff_delay, call_with_retries
+from tests.helpers import MockRpcError
+
+
+class BackoffTestCase(TestCase):
+    """Test case of backoff module."""
+
+    @staticmethod
+    def test_delay_grows_exponentially():
+        """Test that delay doubles with each attempt and stays jittered."""
+        for attempt in range(4):
+            expected = 0.5 * 2**attempt
+            for _ in range(100):
+                delay = backoff_delay(attempt, 0.5, 60)
+                assert expected / 2 <= delay <= expected
+
+    @staticmethod
+    def test_delay_is_capped():
+        """Test that delay never exceeds the cap."""
+        assert 5 <= backoff_delay(10, 0.5, 10) <= 10
+        assert 5 <= backoff_delay(100000, 0.5, 10) <= 10
+
+    @staticmethod
+    def test_call_retries_unavailable():
+        """Test that unavailable errors are retried with backoff."""
+        call = Mock(
+            side_effect=[
+                MockRpcError(grpc.StatusCode.UNAVAILABLE),
+                MockRpcError(grpc.StatusCode.UNAVAILABLE),
+                "result",
+            ]
+        )
+
+        with patch("time.sleep") as sleep_mock:
+            assert call_with_retries(call, 3, 0.5, 10) == "result"
+
+        assert call.call_count == 3
+        first_delay, second_delay = [c[0][0] for c in sleep_mock.call_args_list]
+        assert 0.25 <= first_delay <= 0.5
+        assert 0.5 <= second_delay <= 1
+
+    def test_call_retries_exhausted(self):
+        """Test that the last error is raised when retries are exhausted."""
+        call = Mock(side_effect=MockRpcError(grpc.StatusCode.UNAVAILABLE))
+
+        with patch("time.sleep") as sleep_mock:
+            self.assertRaises(grpc.RpcError, call_with_retries, call, 2, 0.5, 10)
+
+        assert call.call_count == 3
+        assert sleep_mock.call_count == 2
+
+    def test_call_not_retried(self):
+        """Test that non-transient errors are raised immediately."""
+        call = Mock(side_effect=MockRpcError(grpc.StatusCode.INVALID_ARGUMENT))
+
+        with patch("time.sleep") as sleep_mock:
+            self.assertRaises(grpc.RpcError, call_with_retries, call, 2, 0.5, 10)
+
+        assert call.call_count == 1
+        sleep_mock.assert_not_called()
+
+    @staticmethod
+    def test_call_retry_pushback():
+        """Test that delay requested by the server is used for the retry."""
+        call = Mock(
+            side_effect=[
+                MockRpcError(
+                    grpc.StatusCode.UNAVAILABLE, (("grpc-retry-pushback-ms", "1500"),)
+                ),
+                "result",
+            ]
+        )
+
+        with patch("time.sleep") as sleep_mock:
+            assert call_with_retries(call, 3, 0.5, 10) == "result"
+
+        sleep_mock.assert_called_once_with(1.5)
+
+    @staticmethod
+    def test_call_retry_pushback_over_cap():
+        """Test that delay requested by the server is not limited by the cap."""
+        call = Mock(
+            side_effect=[
+                MockRpcError(
+                    grpc.StatusCode.UNAVAILABLE, (("grpc-retry-pushback-ms", "30000"),)
+                ),
+                "result",
+            ]
+        )
+
+        with patch("time.sleep") as sleep_mock:
+            assert call_with_retries(call, 3, 0.5, 10) == "result"
+
+        sleep_mock.assert_called_once_with(30.0)
+
+    def test_call_retry_pushback_stop(self):
+        """Test that negative or malformed delay requested by the server stops retrying."""
+        for value in ("-1", "soon"):
+            call = Mock(
+                side_effect=MockRpcError(
+                    grpc.StatusCode.UNAVAILABLE, (("grpc-retry-pushback-ms", value),)
+                )
+            )
+
+            with patch("time.sleep") as sleep_mock:
+                self.assertRaises(grpc.RpcError, call_with_retries, call, 3, 0.5, 10)
+
+            assert call.call_count == 1
+            sleep_mock.assert_not_called()
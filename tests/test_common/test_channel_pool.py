@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for gRPC channel pool."""
+
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import grpc
+from grpc._channel import Channel
+
+from cosmpy.clients.cosmwasm_client import CosmWasmClient
+from cosmpy.common.channel_pool import ChannelPool, default_ssl_credentials
+from cosmpy.protos.cosmos.bank.v1beta1.query_pb2 import QueryBalanceRequest
+from cosmpy.protos.cosmos.bank.v1beta1.query_pb2_grpc import QueryStub
+
+SHARED_POOLS_PATH = "cosmpy.common.channel_pool._SHARED_POOLS"
+
+
+class ChannelPoolTestCase(TestCase):
+    """Test case of gRPC channel pool module."""
+
+    @staticmethod
+    def test_create():
+        """Test creation of pool with independent channels."""
+        pool = ChannelPool.create("localhost:9090", size=3)
+
+        assert len(pool) == 3
+        assert all(isinstance(channel, Channel) for channel in pool.channels)
+        assert len({id(channel) for channel in pool.channels}) == 3
+        pool.close()
+
+    @staticmethod
+    def test_create_default_options():
+        """Test that pooled channels do not share subchannels by default."""
+        with patch("grpc.insecure_channel") as insecure_channel:
+            ChannelPool.create("localhost:9090", size=2)
+
+        options = dict(insecure_channel.call_args[0][1])
+        assert options["grpc.use_local_subchannel_pool"] == 1
+
+    @staticmethod
+    def test_create_options():
+        """Test that channel options and compression are passed to every channel."""
+        options = (("grpc.keepalive_time_ms", 1000),)
+        with patch("grpc.insecure_channel") as insecure_channel:
+            ChannelPool.create(
+                "localhost:9090",
+                size=2,
+                options=options,
+                compression=grpc.Compression.Gzip,
+            )
+
+        assert insecure_channel.call_count == 2
+        insecure_channel.assert_called_with(
+            "localhost:9090", options, grpc.Compression.Gzip
+        )
+
+    @staticmethod
+    def test_create_secure():
+        """Test that secure pool shares cached default TLS credentials."""
+        with patch("grpc.secure_channel") as secure_channel:
+            ChannelPool.create("localhost:9090", size=2, secure=True)
+
+        credentials = [c[0][1] for c in secure_channel.call_args_list]
+        assert credentials[0] is default_ssl_credentials()
+        assert credentials[1] is credentials[0]
+
+    @staticmethod
+    @patch.dict(SHARED_POOLS_PATH, clear=True)
+    def test_shared():
+        """Test that shared pool is created once per address and settings."""
+        with patch("grpc.insecure_channel") as insecure_channel:
+            first = ChannelPool.shared("shared-test:9090", size=2)
+            second = ChannelPool.shared("shared-test:9090", size=2)
+            other = ChannelPool.shared("shared-test:9091", size=2)
+
+        assert first is second
+        assert other is not first
+        assert insecure_channel.call_count == 4
+        options = dict(insecure_channel.call_args[0][1])
+        assert options["grpc.keepalive_time_ms"] == 30000
+        assert options["grpc.keepalive_timeout_ms"] == 10000
+
+    @staticmethod
+    @patch.dict(SHARED_POOLS_PATH, clear=True)
+    def test_shared_close():
+        """Test that closed shared pool is replaced by a new one."""
+        with patch("grpc.insecure_channel", side_effect=lambda *_: Mock()):
+            with ChannelPool.shared("shared-test:9090", size=2) as first:
+                pass
+            second = ChannelPool.shared("shared-test:9090", size=2)
+
+        assert second is not first
+        for channel in first.channels:
+            channel.close.assert_called_once_with()
+
+        # Closing an already replaced pool keeps the new one registered
+        first.close()
+        with patch("grpc.insecure_channel"):
+            assert ChannelPool.shared("shared-test:9090", size=2) is second
+
+    def test_empty_pool(self):
+        """Test that pool without channels can not be created."""
+        self.assertRaises(ValueError, ChannelPool, [])
+
+    @staticmethod
+    def test_round_robin():
+        """Test that channels are returned in round-robin order."""
+        channels = [Mock(), Mock(), Mock()]
+        pool = ChannelPool(channels)
+
+        assert [pool.next() for _ in range(6)] == channels + channels
+
+    @staticmethod
+    def test_stub_calls_round_robin():
+        """Test that calls of a stub bound to the pool are spread over channels."""
+        channels = [Mock(), Mock()]
+        pool = ChannelPool(channels)
+        stub = QueryStub(pool)
+        request = QueryBalanceRequest(address="address", denom="denom")
+
+        stub.Balance(request)
+        stub.Balance(request)
+        stub.Balance.future(request)
+
+        balance_calls = [
+            channel.unary_unary.return_value for channel in channels
+        ]  # all stub methods share return value of mocked unary_unary
+        assert balance_calls[0].call_count == 1
+        assert balance_calls[1].call_count == 1
+        balance_calls[0].future.assert_called_once_with(request)
+
+    @staticmethod
+    def test_close():
+        """Test that closing the pool closes all channels."""
+        channels = [Mock(), Mock()]
+        with ChannelPool(channels):
+            pass
+
+        for channel in channels:
+            channel.close.assert_called_once_with()
+
+    @staticmethod
+    def test_client_with_pool():
+        """Test that client accepts pool in place of a channel."""
+        pool = ChannelPool.create("localhost:9090", size=2)
+        client = CosmWasmClient(pool)
+
+        assert isinstance(client.bank_client, QueryStub)
+        pool.close()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for JSON helpers."""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from cosmpy.common.json_utils import json_decode, json_encode
+
+DATA = {"key": "value", "nested": {"list": [1, 2.5, True, None]}, "text": "ünï"}
+ENCODED = '{"key":"value","nested":{"list":[1,2.5,true,null]},"text":"ünï"}'.encode(
+    "UTF8"
+)
+
+
+class JSONUtilsTestCase(TestCase):
+    """Test case of JSON helpers module."""
+
+    @staticmethod
+    def test_encode_decode():
+        """Test encoding to compact JSON bytes and decoding back."""
+        assert json_encode(DATA) == ENCODED
+        assert json_decode(ENCODED) == DATA
+        assert json_decode(ENCODED.decode("UTF8")) == DATA
+
+    @staticmethod
+    @patch("cosmpy.common.json_utils.orjson", None)
+    def test_encode_decode_fallback():
+        """Test that standard library fallback produces the same output."""
+        assert json_encode(DATA) == ENCODED
+        assert json_decode(ENCODED) == DATA
+
+    @staticmethod
+    def test_big_int_and_non_str_keys():
+        """Test that integers outside of 64 bits and non-string keys are handled."""
+        data = {"a": 2**128 - 1, "b": -(2**64), "c": 2**64 - 1}
+        encoded = b'{"a":340282366920938463463374607431768211455,"b":-18446744073709551616,"c":18446744073709551615}'
+
+        assert json_encode(data) == encoded
+        assert json_decode(encoded) == data
+        assert json_decode(encoded.decode("UTF8")) == data
+        assert (
+            json_encode({1: "a", "b": [2**70]})
+            == b'{"1":"a","b":[1180591620717411303424]}'
+        )
+
+    @staticmethod
+    @patch("cosmpy.common.json_utils.orjson", None)
+    def test_big_int_and_non_str_keys_fallback():
+        """Test that standard library fallback handles the same data."""
+        data = {"a": 2**128 - 1}
+        encoded = b'{"a":340282366920938463463374607431768211455}'
+
+        assert json_encode(data) == encoded
+        assert json_decode(encoded) == data
+        assert json_encode({1: "a"}) == b'{"1":"a"}'
@@ -168,3 +168,16 @@ class QueryRestClientTestCase(TestCase):
 
         del client
         session_mock.return_value.close.assert_called_once_with()
+
+    @staticmethod
+    def test_session_connection_pool():
+        """Test that session keeps pooled keep-alive connections."""
+
+        client = RestClient("http://some.url")
+        # pylint: disable=protected-access
+        adapter = client._session.get_adapter("http://some.url")
+
+        assert adapter._pool_connections == RestClient.POOL_CONNECTIONS
+        assert adapter._pool_maxsize == RestClient.POOL_MAXSIZE
+        assert adapter.max_retries.total == 0
+        assert client._session.headers["Connection"] == "keep-alive"
@@ -21,7 +21,7 @@
 
 import unittest
 
-from cosmpy.crypto.address import Address
+from cosmpy.crypto.address import Address, _from_bech32
 from cosmpy.crypto.keypairs import PublicKey
 
 
@@ -63,6 +63,14 @@ class AddressTestCase(unittest.TestCase):
             b"U\xc8\xe7\x88\xe2\xeb\xe1\x82\xb9\xc9\xbd\x9a%\x00x9z\x7f\n\xaa",
         )
 
+    def test_create_from_str_cached(self):
+        """Test that repeated parsing of the same string reuses decoded bytes."""
+        value = "fetch12hyw0z8za0sc9wwfhkdz2qrc89a87z42py23vn"
+        hits = _from_bech32.cache_info().hits
+
+        self.assertEqual(bytes(Address(value)), bytes(Address(value)))
+        self.assertGreater(_from_bech32.cache_info().hits, hits)
+
     def test_invalid_byte_length_address(self):
         """Test create Address from bytes with negative result."""
         with self.assertRaises(RuntimeError):